@@ -152,7 +152,9 @@ async def get_node_artifacts(
     if not node:
         raise HTTPException(status_code=404, detail="Node not found")
     
-    artifacts_result = await db.execute(select(Artifact).filter(Artifact.node_id == node_id))
+    artifacts_result = await db.execute(
+        select(Artifact).filter(Artifact.node_id == node_id).order_by(Artifact.created_at)
+    )
     artifacts = artifacts_result.scalars().all()
     
     return ArtifactList(
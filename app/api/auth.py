@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
@@ -42,9 +42,15 @@ async def login(payload: LoginRequest, db: AsyncSession = Depends(get_db)):
     return TokenResponse(access_token=token)
 
 
-async def get_current_user(
-    token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)
-):
+async def get_current_user_id(request: Request, token: str = Depends(oauth2_scheme)) -> uuid.UUID:
+    """Resolve the caller's user id from the JWT alone, without touching the database.
+
+    The decoded id is memoized on ``request.state`` so several dependencies in the
+    same request only decode the token once.
+    """
+    cached = getattr(request.state, "user_id", None)
+    if cached is not None:
+        return cached
     try:
         payload = decode_token(token)
         user_id = payload.get("sub")
@@ -53,11 +59,24 @@ async def get_current_user(
         uid = uuid.UUID(str(user_id))
     except Exception:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="invalid_token")
+    request.state.user_id = uid
+    return uid
+
+
+async def get_current_user(
+    request: Request,
+    uid: uuid.UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db),
+):
+    cached = getattr(request.state, "user", None)
+    if cached is not None:
+        return cached
 
     res = await db.execute(select(User).where(User.id == uid))
     user = res.scalar_one_or_none()
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="user_not_found")
+    request.state.user = user
     return user
 
 
@@ -1,16 +1,22 @@
-from typing import List, Optional, Union
+from datetime import datetime, timezone
+from typing import AsyncIterator, List, Optional, Union
 from uuid import UUID
 import os
 import mimetypes
 from pathlib import Path
 
-from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File, Form
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, UploadFile, File, Form
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_
+from sqlalchemy import select, update, func, bindparam, and_, or_, exists, inspect, lambda_stmt
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
 from sqlalchemy.orm import selectinload
 
+from app.cache.node_response import node_cache_key, node_response_cache, with_request_fields
+from app.db.bulk import BULK_COPY_THRESHOLD, bulk_copy_nodes
 from app.db.deps import get_db
 from app.models.user import User
+from app.models import NODE_SUBTYPES_LOADER
 from app.models.node import Node, Task, Note, SmartFolder, Template, Folder
 from app.models.tag import Tag, node_tags
 from app.schemas.node import (
@@ -18,16 +24,25 @@ from app.schemas.node import (
     NoteCreate, NoteUpdate, NoteResponse, FolderCreate, FolderUpdate, FolderResponse,
     SmartFolderCreate, SmartFolderUpdate, SmartFolderResponse,
     TemplateCreate, TemplateUpdate, TemplateResponse,
-    NodeResponseUnion, NodeFilter, NodeTree, NodeTreeItem,
-    NodeMove, NodeReorder, create_node_response,
+    NodeResponseUnion, NodeFilter, NodeTree,
+    NodeMove, NodeReorder, NodeBulkCreate, NodeBulkUpdate, create_node_response,
     SetTemplateTargetNodeRequest, SetTemplateCreateContainerRequest
 )
 from app.schemas.tag import TagResponse
 from app.api.auth import get_current_user
 from app.services.smart_folder_engine import SmartFolderRulesEngine
+from app.utils.serialize import serialize_models, stream_tree
 
 router = APIRouter(prefix="/nodes", tags=["nodes"])
 
+# Mapped class for each node_type
+NODE_CLASSES = {"task": Task, "note": Note, "folder": Folder, "smart_folder": SmartFolder, "template": Template}
+
+# Cached base statement for node listings; callers extend it with further lambdas
+LIST_NODES_STMT = lambda_stmt(
+    lambda: select(Node).options(NODE_SUBTYPES_LOADER).order_by(Node.sort_order, Node.created_at)
+)
+
 
 # Template-specific endpoints (must come before /{node_id} routes)
 @router.get("/templates", response_model=List[TemplateResponse])
@@ -50,7 +65,7 @@ async def list_templates(
     templates = result.scalars().all()
     
     # Convert to response format using batch processing
-    return await convert_nodes_to_responses_batch(templates, session)
+    return _node_list_response(await convert_nodes_to_responses_batch(templates, session))
 
 
 @router.post("/templates/{template_id}/instantiate", response_model=NodeResponseUnion)
@@ -142,14 +157,13 @@ async def instantiate_template(
 
 
 # CRUD Operations
-@router.post("/", response_model=NodeResponseUnion)
-async def create_node(
+async def _build_node(
     node_data: Union[TaskCreate, NoteCreate, FolderCreate, SmartFolderCreate, TemplateCreate],
-    session: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
-) -> NodeResponseUnion:
-    """Create a new node (task, note, folder, smart folder, or template)"""
-    
+    session: AsyncSession,
+    current_user: User
+) -> Node:
+    """Validate create data and build the (unsaved) type-specific node"""
+
     # Create type-specific node directly (polymorphic)
     if node_data.node_type == "task":
         task_data = node_data.task_data
@@ -217,7 +231,7 @@ async def create_node(
         elif smart_folder_data.rules is not None:
             # Legacy rules provided - validate them
             rules_engine = SmartFolderRulesEngine(session)
-            rules_data = smart_folder_data.rules.model_dump() if hasattr(smart_folder_data.rules, 'model_dump') else smart_folder_data.rules
+            rules_data = smart_folder_data.rules.model_dump()
             validation_errors = rules_engine.validate_rules(rules_data)
             if validation_errors:
                 raise HTTPException(
@@ -231,7 +245,7 @@ async def create_node(
             title=node_data.title,
             sort_order=node_data.sort_order,
             rule_id=rule_id,
-            rules=smart_folder_data.rules or {"conditions": [], "logic": "AND"} if not rule_id else None,
+            rules=(smart_folder_data.rules.model_dump() if smart_folder_data.rules else {"conditions": [], "logic": "AND"}) if not rule_id else None,
             auto_refresh=smart_folder_data.auto_refresh,
             description=smart_folder_data.description
         )
@@ -250,6 +264,18 @@ async def create_node(
         )
     else:
         raise HTTPException(status_code=400, detail="Invalid node_type")
+
+    return node
+
+
+@router.post("/", response_model=NodeResponseUnion)
+async def create_node(
+    node_data: Union[TaskCreate, NoteCreate, FolderCreate, SmartFolderCreate, TemplateCreate],
+    session: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+) -> NodeResponseUnion:
+    """Create a new node (task, note, folder, smart folder, or template)"""
+    node = await _build_node(node_data, session, current_user)
     
     session.add(node)
     await session.commit()
@@ -258,6 +284,36 @@ async def create_node(
     return await convert_node_to_response(node, session)
 
 
+@router.post("/bulk", response_model=List[NodeResponseUnion])
+async def create_nodes_bulk(
+    bulk_data: NodeBulkCreate,
+    session: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+) -> List[NodeResponseUnion]:
+    """Create many nodes in a single transaction"""
+    nodes = [await _build_node(node_data, session, current_user) for node_data in bulk_data.nodes]
+    if not nodes:
+        return []
+
+    # Large batches are streamed with COPY; small ones go through a normal flush
+    if len(nodes) >= BULK_COPY_THRESHOLD:
+        await bulk_copy_nodes(session, nodes)
+    else:
+        session.add_all(nodes)
+        await session.flush()
+    node_ids = [node.id for node in nodes]
+    await session.commit()
+
+    result = await session.execute(
+        select(Node)
+        .options(NODE_SUBTYPES_LOADER)
+        .where(Node.id.in_(node_ids))
+        .order_by(Node.sort_order, Node.created_at)
+        .execution_options(populate_existing=True)
+    )
+    return _node_list_response(await convert_nodes_to_responses_batch(result.scalars().all(), session))
+
+
 @router.get("/{node_id}", response_model=NodeResponseUnion)
 async def get_node(
     node_id: UUID,
@@ -268,56 +324,53 @@ async def get_node(
     return await get_node_by_id(node_id, session, current_user)
 
 
-@router.put("/{node_id}", response_model=NodeResponseUnion)
-async def update_node(
-    node_id: UUID,
+async def _node_changes(
+    node_type: str,
     node_data: Union[TaskUpdate, NoteUpdate, FolderUpdate, SmartFolderUpdate, TemplateUpdate],
-    session: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
-) -> NodeResponseUnion:
-    """Update a node"""
-    
-    # Get the node
-    node = await get_node_by_id_raw(node_id, session, current_user)
-    
+    session: AsyncSession,
+    current_user: User
+) -> dict:
+    """Validate update data and return the attribute changes for a node of node_type"""
+    changes = {}
+
     # Update base node fields
     if node_data.title is not None:
-        node.title = node_data.title
+        changes["title"] = node_data.title
     # Check if parent_id was explicitly provided (even if it's None/null)
     # Use model_fields_set to check if parent_id was explicitly provided in the request
     if 'parent_id' in node_data.model_fields_set:
-        node.parent_id = node_data.parent_id
+        changes["parent_id"] = node_data.parent_id
     if node_data.sort_order is not None:
-        node.sort_order = node_data.sort_order
+        changes["sort_order"] = node_data.sort_order
     
     # Update type-specific data
-    if isinstance(node_data, TaskUpdate) and node_data.task_data and isinstance(node, Task):
+    if isinstance(node_data, TaskUpdate) and node_data.task_data and node_type == "task":
         task_data = node_data.task_data
         if task_data.description is not None:
-            node.description = task_data.description
+            changes["description"] = task_data.description
         if task_data.status is not None:
-            node.status = task_data.status
+            changes["status"] = task_data.status
         if task_data.priority is not None:
-            node.priority = task_data.priority
+            changes["priority"] = task_data.priority
         if task_data.due_at is not None:
-            node.due_at = task_data.due_at
+            changes["due_at"] = task_data.due_at
         if task_data.earliest_start_at is not None:
-            node.earliest_start_at = task_data.earliest_start_at
+            changes["earliest_start_at"] = task_data.earliest_start_at
         if task_data.completed_at is not None:
-            node.completed_at = task_data.completed_at
+            changes["completed_at"] = task_data.completed_at
         if task_data.archived is not None:
-            node.archived = task_data.archived
+            changes["archived"] = task_data.archived
         if task_data.recurrence_rule is not None:
-            node.recurrence_rule = task_data.recurrence_rule
+            changes["recurrence_rule"] = task_data.recurrence_rule
         if task_data.recurrence_anchor is not None:
-            node.recurrence_anchor = task_data.recurrence_anchor
+            changes["recurrence_anchor"] = task_data.recurrence_anchor
             
-    elif isinstance(node_data, NoteUpdate) and node_data.note_data and isinstance(node, Note):
+    elif isinstance(node_data, NoteUpdate) and node_data.note_data and node_type == "note":
         note_data = node_data.note_data
         if note_data.body is not None:
-            node.body = note_data.body
+            changes["body"] = note_data.body
             
-    elif isinstance(node_data, SmartFolderUpdate) and node_data.smart_folder_data and isinstance(node, SmartFolder):
+    elif isinstance(node_data, SmartFolderUpdate) and node_data.smart_folder_data and node_type == "smart_folder":
         smart_folder_data = node_data.smart_folder_data
         
         # Handle rule_id update (new methodology)
@@ -339,43 +392,106 @@ async def update_node(
                     status_code=404,
                     detail=f"Rule {smart_folder_data.rule_id} not found or not accessible"
                 )
-            node.rule_id = smart_folder_data.rule_id
+            changes["rule_id"] = smart_folder_data.rule_id
             
         # Handle legacy rules update (deprecated but kept for backward compatibility)
         if smart_folder_data.rules is not None:
             # Validate rules if provided
             from app.services.smart_folder_engine import SmartFolderRulesEngine
             rules_engine = SmartFolderRulesEngine(session)
-            validation_errors = rules_engine.validate_rules(smart_folder_data.rules)
+            rules_data = smart_folder_data.rules.model_dump()
+            validation_errors = rules_engine.validate_rules(rules_data)
             if validation_errors:
                 raise HTTPException(
                     status_code=400, 
                     detail=f"Invalid rules: {'; '.join(validation_errors)}"
                 )
-            node.rules = smart_folder_data.rules
+            changes["rules"] = rules_data
             
         if smart_folder_data.auto_refresh is not None:
-            node.auto_refresh = smart_folder_data.auto_refresh
+            changes["auto_refresh"] = smart_folder_data.auto_refresh
         if smart_folder_data.description is not None:
-            node.description = smart_folder_data.description
+            changes["description"] = smart_folder_data.description
             
-    elif isinstance(node_data, FolderUpdate) and node_data.folder_data and isinstance(node, Folder):
+    elif isinstance(node_data, FolderUpdate) and node_data.folder_data and node_type == "folder":
         folder_data = node_data.folder_data
         if folder_data.description is not None:
-            node.description = folder_data.description
+            changes["description"] = folder_data.description
 
-    elif isinstance(node_data, TemplateUpdate) and node_data.template_data and isinstance(node, Template):
+    elif isinstance(node_data, TemplateUpdate) and node_data.template_data and node_type == "template":
         template_data = node_data.template_data
         if template_data.description is not None:
-            node.description = template_data.description
+            changes["description"] = template_data.description
         if template_data.category is not None:
-            node.category = template_data.category
+            changes["category"] = template_data.category
         if template_data.usage_count is not None:
-            node.usage_count = template_data.usage_count
+            changes["usage_count"] = template_data.usage_count
         if template_data.target_node_id is not None:
-            node.target_node_id = template_data.target_node_id
+            changes["target_node_id"] = template_data.target_node_id
         if template_data.create_container is not None:
-            node.create_container = template_data.create_container
+            changes["create_container"] = template_data.create_container
+
+    return changes
+
+
+@router.put("/bulk", response_model=List[NodeResponseUnion])
+async def update_nodes_bulk(
+    bulk_data: NodeBulkUpdate,
+    session: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+) -> List[NodeResponseUnion]:
+    """Update many nodes in a single transaction"""
+    node_ids = [node_id for node_id, _ in bulk_data.updates]
+    if not node_ids:
+        return []
+
+    types_result = await session.execute(
+        select(Node.id, Node.node_type).where(Node.id.in_(node_ids), Node.owner_id == current_user.id)
+    )
+    node_types = dict(types_result.all())
+    missing = [str(node_id) for node_id in node_ids if node_id not in node_types]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Nodes not found: {', '.join(missing)}")
+
+    # One executemany UPDATE per (node class, changed columns) group instead of
+    # one statement per node. updated_at is always set so the nodes row (and the
+    # response cache key) changes even when only subtype columns do.
+    now = datetime.now(timezone.utc)
+    groups = {}
+    for node_id, node_data in bulk_data.updates:
+        node_type = node_types[node_id]
+        changes = await _node_changes(node_type, node_data, session, current_user)
+        row = {"id": node_id, **changes, "updated_at": now}
+        groups.setdefault((NODE_CLASSES[node_type], frozenset(row)), []).append(row)
+
+    for (node_class, _), rows in groups.items():
+        await session.execute(update(node_class), rows)
+    await session.commit()
+
+    result = await session.execute(
+        select(Node)
+        .options(NODE_SUBTYPES_LOADER)
+        .where(Node.id.in_(node_ids))
+        .order_by(Node.sort_order, Node.created_at)
+        .execution_options(populate_existing=True)
+    )
+    return _node_list_response(await convert_nodes_to_responses_batch(result.scalars().all(), session))
+
+
+@router.put("/{node_id}", response_model=NodeResponseUnion)
+async def update_node(
+    node_id: UUID,
+    node_data: Union[TaskUpdate, NoteUpdate, FolderUpdate, SmartFolderUpdate, TemplateUpdate],
+    session: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+) -> NodeResponseUnion:
+    """Update a node"""
+    
+    # Get the node
+    node = await get_node_by_id_raw(node_id, session, current_user)
+    
+    for key, value in (await _node_changes(node.node_type, node_data, session, current_user)).items():
+        setattr(node, key, value)
     
     await session.commit()
     return await get_node_by_id(node_id, session, current_user)
@@ -423,39 +539,45 @@ async def list_nodes(
 ) -> List[NodeResponseUnion]:
     """List nodes with filtering and pagination"""
     
-    # Build base query (include all node types including templates)
-    query = select(Node).where(Node.owner_id == current_user.id)
+    # Build base query (include all node types including templates). Each step is
+    # a lambda so the composed statement is cached per filter combination instead
+    # of being rebuilt and recompiled on every request.
+    owner_id = current_user.id
+    query = LIST_NODES_STMT + (lambda s: s.where(Node.owner_id == owner_id))
     
     # Apply filters
-    if filter_params.node_type:
-        query = query.where(Node.node_type == filter_params.node_type)
+    node_type = filter_params.node_type
+    if node_type:
+        query += lambda s: s.where(Node.node_type == node_type)
     
-    if filter_params.parent_id is not None:
-        query = query.where(Node.parent_id == filter_params.parent_id)
+    parent_id = filter_params.parent_id
+    if parent_id is not None:
+        query += lambda s: s.where(Node.parent_id == parent_id)
     
     if filter_params.search:
         search_term = f"%{filter_params.search}%"
-        query = query.where(Node.title.ilike(search_term))
-    
-    # Add joins for type-specific filtering
-    if filter_params.status or filter_params.priority or filter_params.archived is not None:
-        query = query.join(Task).where(
-            and_(
-                filter_params.status is None or Task.status == filter_params.status,
-                filter_params.priority is None or Task.priority == filter_params.priority,
-                filter_params.archived is None or Task.archived == filter_params.archived
-            )
-        )
+        query += lambda s: s.where(Node.title.ilike(search_term))
+    
+    # Type-specific filtering against node_tasks directly (no aliased Task entity)
+    status, priority, archived = filter_params.status, filter_params.priority, filter_params.archived
+    if status or priority or archived is not None:
+        query += lambda s: s.join(Task.__table__, Task.id == Node.id)
+        if status:
+            query += lambda s: s.where(Task.status == status)
+        if priority:
+            query += lambda s: s.where(Task.priority == priority)
+        if archived is not None:
+            query += lambda s: s.where(Task.archived == archived)
     
     # Apply pagination
-    query = query.offset(filter_params.offset).limit(filter_params.limit)
-    query = query.order_by(Node.sort_order, Node.created_at)
+    offset, limit = filter_params.offset, filter_params.limit
+    query += lambda s: s.offset(offset).limit(limit)
     
     result = await session.execute(query)
     nodes = result.scalars().all()
     
     # Convert to response format using batch processing
-    return await convert_nodes_to_responses_batch(nodes, session)
+    return _node_list_response(await convert_nodes_to_responses_batch(nodes, session))
 
 
 @router.get("/tree/{root_id}", response_model=NodeTree)
@@ -468,14 +590,10 @@ async def get_node_tree(
 ) -> NodeTree:
     """Get node tree structure"""
     
-    # Build recursive query to get tree structure
-    tree_items = await build_node_tree(root_id, max_depth, expanded_ids, session, current_user)
-    
-    return NodeTree(
-        root_id=root_id,
-        items=tree_items,
-        total_count=len(tree_items)
-    )
+    # Rows are encoded and sent as they stream from the DB; the full tree is
+    # never held in memory as objects or as one JSON buffer
+    tree_items = iter_node_tree(root_id, max_depth, expanded_ids, session, current_user)
+    return StreamingResponse(stream_tree(root_id, tree_items), media_type="application/json")
 
 
 @router.post("/move")
@@ -508,24 +626,34 @@ async def reorder_nodes(
 ):
     """Reorder nodes within the same parent"""
     
-    # Update sort orders
-    for i, node_id in enumerate(reorder_data.node_ids):
-        query = (
-            select(Node)
-            .where(Node.id == node_id)
-            .where(Node.owner_id == current_user.id)
-        )
-        result = await session.execute(query)
-        node = result.scalar_one_or_none()
-        
-        if node:
-            node.sort_order = i
+    # One UPDATE for the whole list: sort_order is each id's 0-based position
+    # in the array, joined on id via unnest ... WITH ORDINALITY
+    new_order = (
+        func.unnest(bindparam("node_ids", reorder_data.node_ids, type_=ARRAY(PG_UUID(as_uuid=True))))
+        .table_valued("id", with_ordinality="ord")
+        .render_derived()
+    )
+    await session.execute(
+        update(Node)
+        .where(Node.id == new_order.c.id, Node.owner_id == current_user.id)
+        .values(sort_order=new_order.c.ord - 1)
+        .execution_options(synchronize_session=False)
+    )
     
     await session.commit()
     return {"message": "Nodes reordered successfully"}
 
 
 # Helper functions
+def _subtype_columns_loaded(node: Node) -> bool:
+    """True when node is a subtype instance whose own columns are already loaded"""
+    if type(node) is Node:
+        return False
+    state = inspect(node)
+    eager_columns = {prop.key for prop in state.mapper.column_attrs if not prop.deferred}
+    return not (state.unloaded & eager_columns)
+
+
 async def get_node_by_id_raw(
     node_id: UUID, 
     session: AsyncSession, 
@@ -534,6 +662,7 @@ async def get_node_by_id_raw(
     """Get raw node object with ownership check"""
     query = (
         select(Node)
+        .options(NODE_SUBTYPES_LOADER)
         .where(Node.id == node_id)
         .where(Node.owner_id == current_user.id)
     )
@@ -557,37 +686,25 @@ async def get_node_by_id(
 
 
 async def convert_node_to_response(node: Node, session: AsyncSession,
-                                    preloaded_children_counts: dict = None,
                                     preloaded_tags: dict = None) -> NodeResponseUnion:
     """Convert node to appropriate response format with optional preloaded data"""
 
-    # Use preloaded children count if available, otherwise query
-    if preloaded_children_counts and node.id in preloaded_children_counts:
-        children_count = preloaded_children_counts[node.id]
-    else:
-        children_query = select(func.count(Node.id)).where(Node.parent_id == node.id)
-        children_result = await session.execute(children_query)
-        children_count = children_result.scalar() or 0
+    # Maintained by the nodes_child_count trigger; no per-node count query
+    children_count = node.child_count
 
     # Use preloaded tags if available, otherwise query
     if preloaded_tags and node.id in preloaded_tags:
         tags = preloaded_tags[node.id]
     else:
-        tags_query = select(Tag).join(node_tags).where(node_tags.c.node_id == node.id)
+        tags_query = select(Tag).join(node_tags).where(
+            node_tags.c.owner_id == node.owner_id,
+            node_tags.c.node_id == node.id,
+        )
         tags_result = await session.execute(tags_query)
         tags = tags_result.scalars().all()
 
     # Convert tags to response format
-    tag_responses = [
-        TagResponse(
-            id=tag.id,
-            name=tag.name,
-            description=tag.description,
-            color=tag.color,
-            created_at=tag.created_at
-        )
-        for tag in tags
-    ]
+    tag_responses = [_tag_response(tag) for tag in tags]
 
     base_data = {
         "id": node.id,
@@ -603,13 +720,23 @@ async def convert_node_to_response(node: Node, session: AsyncSession,
         "tags": tag_responses
     }
 
+    # The node's own fields are fixed for a given updated_at; reuse the cached
+    # response and only swap in this request's tags and children count
+    cache_key = node_cache_key(node)
+    cached = node_response_cache.get(cache_key)
+    if cached is not None:
+        return with_request_fields(cached, children_count, tag_responses)
+
     if node.node_type == "task":
         # Get task-specific data
-        task_query = select(Task).where(Task.id == node.id)
-        task_result = await session.execute(task_query)
-        task = task_result.scalar_one()
+        if _subtype_columns_loaded(node):
+            task = node
+        else:
+            task_query = select(Task).where(Task.id == node.id)
+            task_result = await session.execute(task_query)
+            task = task_result.scalar_one()
 
-        return TaskResponse(
+        response = TaskResponse(
             **base_data,
             task_data={
                 "description": task.description,
@@ -626,11 +753,14 @@ async def convert_node_to_response(node: Node, session: AsyncSession,
 
     elif node.node_type == "note":
         # Get note-specific data
-        note_query = select(Note).where(Note.id == node.id)
-        note_result = await session.execute(note_query)
-        note = note_result.scalar_one()
+        if _subtype_columns_loaded(node):
+            note = node
+        else:
+            note_query = select(Note).where(Note.id == node.id)
+            note_result = await session.execute(note_query)
+            note = note_result.scalar_one()
 
-        return NoteResponse(
+        response = NoteResponse(
             **base_data,
             note_data={
                 "body": note.body
@@ -639,11 +769,14 @@ async def convert_node_to_response(node: Node, session: AsyncSession,
 
     elif node.node_type == "smart_folder":
         # Get smart folder-specific data
-        smart_folder_query = select(SmartFolder).where(SmartFolder.id == node.id)
-        smart_folder_result = await session.execute(smart_folder_query)
-        smart_folder = smart_folder_result.scalar_one()
+        if _subtype_columns_loaded(node):
+            smart_folder = node
+        else:
+            smart_folder_query = select(SmartFolder).where(SmartFolder.id == node.id)
+            smart_folder_result = await session.execute(smart_folder_query)
+            smart_folder = smart_folder_result.scalar_one()
 
-        return SmartFolderResponse(
+        response = SmartFolderResponse(
             **base_data,
             smart_folder_data={
                 "rule_id": smart_folder.rule_id,
@@ -655,11 +788,14 @@ async def convert_node_to_response(node: Node, session: AsyncSession,
 
     elif node.node_type == "template":
         # Get template-specific data
-        template_query = select(Template).where(Template.id == node.id)
-        template_result = await session.execute(template_query)
-        template = template_result.scalar_one()
+        if _subtype_columns_loaded(node):
+            template = node
+        else:
+            template_query = select(Template).where(Template.id == node.id)
+            template_result = await session.execute(template_query)
+            template = template_result.scalar_one()
 
-        return TemplateResponse(
+        response = TemplateResponse(
             **base_data,
             template_data={
                 "description": template.description,
@@ -672,12 +808,15 @@ async def convert_node_to_response(node: Node, session: AsyncSession,
 
     elif node.node_type == "folder":
         # Get folder-specific data
-        folder_query = select(Folder).where(Folder.id == node.id)
-        folder_result = await session.execute(folder_query)
-        folder = folder_result.scalar_one_or_none()
+        if _subtype_columns_loaded(node):
+            folder = node
+        else:
+            folder_query = select(Folder).where(Folder.id == node.id)
+            folder_result = await session.execute(folder_query)
+            folder = folder_result.scalar_one_or_none()
 
         if folder:
-            return FolderResponse(
+            response = FolderResponse(
                 **base_data,
                 folder_data={
                     "description": folder.description
@@ -685,11 +824,33 @@ async def convert_node_to_response(node: Node, session: AsyncSession,
             )
         else:
             # Fallback for folders without description
-            return FolderResponse(**base_data)
+            response = FolderResponse(**base_data)
 
     else:
         raise ValueError(f"Unknown node type: {node.node_type}")
 
+    node_response_cache.set(cache_key, response)
+    return response
+
+
+def _node_list_response(items: List[NodeResponseUnion]) -> Response:
+    """JSON response for a list of built node responses.
+
+    The items are already validated response models, so they are encoded
+    directly instead of letting FastAPI re-validate them against response_model.
+    """
+    return Response(content=serialize_models(items), media_type="application/json")
+
+
+def _tag_response(tag: Tag) -> TagResponse:
+    return TagResponse(
+        id=tag.id,
+        name=tag.name,
+        description=tag.description,
+        color=tag.color,
+        created_at=tag.created_at
+    )
+
 
 async def convert_nodes_to_responses_batch(nodes: List[Node], session: AsyncSession) -> List[NodeResponseUnion]:
     """Convert multiple nodes to response format efficiently with batched queries"""
@@ -697,21 +858,15 @@ async def convert_nodes_to_responses_batch(nodes: List[Node], session: AsyncSess
         return []
 
     node_ids = [node.id for node in nodes]
+    owner_ids = {node.owner_id for node in nodes}
 
-    # Batch load children counts
-    children_counts_query = (
-        select(Node.parent_id, func.count(Node.id))
-        .where(Node.parent_id.in_(node_ids))
-        .group_by(Node.parent_id)
-    )
-    children_counts_result = await session.execute(children_counts_query)
-    children_counts = {parent_id: count for parent_id, count in children_counts_result.fetchall()}
+    # Children counts come from the trigger-maintained Node.child_count column
 
     # Batch load tags
     tags_query = (
         select(Tag, node_tags.c.node_id)
         .join(node_tags)
-        .where(node_tags.c.node_id.in_(node_ids))
+        .where(node_tags.c.owner_id.in_(owner_ids), node_tags.c.node_id.in_(node_ids))
     )
     tags_result = await session.execute(tags_query)
 
@@ -722,12 +877,18 @@ async def convert_nodes_to_responses_batch(nodes: List[Node], session: AsyncSess
             node_tags_dict[node_id] = []
         node_tags_dict[node_id].append(tag)
 
-    # Batch load type-specific data
-    type_specific_data = {}
+    # Responses already built for this (id, updated_at) only need fresh tags/counts
+    cached_responses = node_response_cache.get_many(node_cache_key(node) for node in nodes)
+
+    # Type-specific data: nodes loaded with NODE_SUBTYPES_LOADER already carry their
+    # subtype columns, so only fall back to a query for the rest.
+    type_specific_data = {node.id: node for node in nodes if _subtype_columns_loaded(node)}
 
-    # Group nodes by type
+    # Group remaining nodes by type
     nodes_by_type = {}
     for node in nodes:
+        if node.id in type_specific_data or node_cache_key(node) in cached_responses:
+            continue
         if node.node_type not in nodes_by_type:
             nodes_by_type[node.node_type] = []
         nodes_by_type[node.node_type].append(node)
@@ -769,12 +930,18 @@ async def convert_nodes_to_responses_batch(nodes: List[Node], session: AsyncSess
     # Convert all nodes to responses
     responses = []
     for node in nodes:
+        cache_key = node_cache_key(node)
+        cached = cached_responses.get(cache_key)
+        if cached is not None:
+            tag_responses = [_tag_response(tag) for tag in node_tags_dict.get(node.id, [])]
+            responses.append(with_request_fields(cached, node.child_count, tag_responses))
+            continue
         response = await convert_node_to_response_with_preloaded_data(
             node,
-            children_counts.get(node.id, 0),
             node_tags_dict.get(node.id, []),
             type_specific_data.get(node.id)
         )
+        node_response_cache.set(cache_key, response)
         responses.append(response)
 
     return responses
@@ -782,23 +949,14 @@ async def convert_nodes_to_responses_batch(nodes: List[Node], session: AsyncSess
 
 async def convert_node_to_response_with_preloaded_data(
     node: Node,
-    children_count: int,
     tags: List[Tag],
     type_specific_obj = None
 ) -> NodeResponseUnion:
     """Convert node to response format using preloaded data"""
+    children_count = node.child_count
 
     # Convert tags to response format
-    tag_responses = [
-        TagResponse(
-            id=tag.id,
-            name=tag.name,
-            description=tag.description,
-            color=tag.color,
-            created_at=tag.created_at
-        )
-        for tag in tags
-    ]
+    tag_responses = [_tag_response(tag) for tag in tags]
 
     base_data = {
         "id": node.id,
@@ -873,47 +1031,41 @@ async def convert_node_to_response_with_preloaded_data(
         raise ValueError(f"Unknown node type: {node.node_type}")
 
 
-async def build_node_tree(
+async def iter_node_tree(
     root_id: Optional[UUID],
     max_depth: int,
     expanded_ids: List[UUID],
     session: AsyncSession,
     current_user: User
-) -> List[NodeTreeItem]:
-    """Build hierarchical tree structure"""
+) -> AsyncIterator[dict]:
+    """Stream hierarchical tree structure (items as NodeTreeItem-shaped dicts)"""
     
     # This is a simplified version - would need more complex recursive logic
-    # For now, just return flat list of children
+    # For now, just return flat list of children.
+    # Only the hot base columns are selected; subtype tables are never touched.
     query = (
-        select(Node)
+        select(
+            Node.id, Node.title, Node.node_type, Node.parent_id, Node.sort_order,
+            Node.child_count.label("children_count"),
+        )
         .where(Node.owner_id == current_user.id)
         .where(Node.parent_id == root_id)
         .order_by(Node.sort_order, Node.created_at)
+        .execution_options(yield_per=1000)
     )
-    
-    result = await session.execute(query)
-    nodes = result.scalars().all()
-    
-    tree_items = []
-    for node in nodes:
-        # Get children count
-        children_query = select(func.count(Node.id)).where(Node.parent_id == node.id)
-        children_result = await session.execute(children_query)
-        children_count = children_result.scalar() or 0
-        
-        tree_items.append(NodeTreeItem(
-            id=node.id,
-            title=node.title,
-            node_type=node.node_type,
-            parent_id=node.parent_id,
-            sort_order=node.sort_order,
-            is_list=children_count > 0,
-            children_count=children_count,
-            level=0,  # Would calculate based on depth
-            expanded=node.id in expanded_ids
-        ))
-    
-    return tree_items
+    expanded = set(expanded_ids)
+    
+    result = await session.stream(query)
+    async for node in result:
+        # Rows come straight from our own query: no model, just the row's columns
+        # plus the computed fields, ready for serialize_node_row
+        yield {
+            **node._mapping,
+            "is_list": node.children_count > 0,
+            "level": 0,  # Would calculate based on depth
+            "expanded": node.id in expanded,
+            "preview_data": None
+        }
 
 
 async def validate_move(
@@ -970,17 +1122,21 @@ async def attach_tag_to_node(
     
     # Check if already attached using a direct query to avoid lazy loading
     from app.models.node_associations import node_tags
-    existing_query = select(node_tags).where(
-        node_tags.c.node_id == node_id,
-        node_tags.c.tag_id == tag_id
+    existing_query = select(
+        exists().where(
+            node_tags.c.owner_id == current_user.id,
+            node_tags.c.node_id == node_id,
+            node_tags.c.tag_id == tag_id
+        )
     )
     existing_result = await session.execute(existing_query)
-    existing = existing_result.first()
+    existing = existing_result.scalar()
     
     if not existing:
         # Use direct insert into association table
         from sqlalchemy import insert
         insert_stmt = insert(node_tags).values(
+            owner_id=current_user.id,
             node_id=node_id,
             tag_id=tag_id
         )
@@ -1015,17 +1171,21 @@ async def detach_tag_from_node(
     
     # Check if tag is attached using direct query to avoid lazy loading
     from app.models.node_associations import node_tags
-    existing_query = select(node_tags).where(
-        node_tags.c.node_id == node_id,
-        node_tags.c.tag_id == tag_id
+    existing_query = select(
+        exists().where(
+            node_tags.c.owner_id == current_user.id,
+            node_tags.c.node_id == node_id,
+            node_tags.c.tag_id == tag_id
+        )
     )
     existing_result = await session.execute(existing_query)
-    existing = existing_result.first()
+    existing = existing_result.scalar()
     
     if existing:
         # Use direct delete from association table
         from sqlalchemy import delete
         delete_stmt = delete(node_tags).where(
+            node_tags.c.owner_id == current_user.id,
             node_tags.c.node_id == node_id,
             node_tags.c.tag_id == tag_id
         )
@@ -1089,7 +1249,7 @@ async def preview_smart_folder_rules_new(
     )
 
     # Convert to response format using batch processing
-    return await convert_nodes_to_responses_batch(preview_nodes, session)
+    return _node_list_response(await convert_nodes_to_responses_batch(preview_nodes, session))
 
 
 @router.get("/{smart_folder_id}/contents", response_model=List[NodeResponseUnion])
@@ -1115,13 +1275,14 @@ async def get_smart_folder_contents(
     
     # Evaluate rules and get matching nodes
     rules_engine = SmartFolderRulesEngine(session)
-    matching_nodes = await rules_engine.evaluate_smart_folder(smart_folder, current_user.id)
+    # Nodes past the requested page are not loaded
+    matching_nodes = await rules_engine.evaluate_smart_folder(smart_folder, current_user.id, limit=offset + limit)
     
     # Apply pagination
     paginated_nodes = matching_nodes[offset:offset + limit]
 
     # Convert to response format using batch processing
-    return await convert_nodes_to_responses_batch(paginated_nodes, session)
+    return _node_list_response(await convert_nodes_to_responses_batch(paginated_nodes, session))
 
 
 @router.post("/{smart_folder_id}/preview", response_model=List[NodeResponseUnion])
@@ -1155,7 +1316,7 @@ async def preview_smart_folder_rules(
     )
 
     # Convert to response format using batch processing
-    return await convert_nodes_to_responses_batch(preview_nodes, session)
+    return _node_list_response(await convert_nodes_to_responses_batch(preview_nodes, session))
 
 
 @router.put("/{smart_folder_id}/rules", response_model=SmartFolderResponse)
@@ -10,7 +10,7 @@ from app.models.note_list import NoteList
 from app.models.task import Task
 from app.models.tag import Tag
 from app.models.user import User
-from app.models.associations import tag_notes, note_links, note_tasks, task_notes, note_list_taglists
+from app.models.associations import tag_notes, note_links, task_notes, note_list_taglists
 from app.models.tag_list import TagList
 from app.models.note_list import NoteList
 from app.schemas.note import NoteCreate, NoteUpdate, NoteOut
@@ -432,7 +432,7 @@ async def list_note_tasks(
 ):
     note = await _ensure_owned_note(db, current_user.id, note_id)
     res = await db.execute(
-        select(Task).join(note_tasks, note_tasks.c.task_id == Task.id).where(note_tasks.c.note_id == note.id)
+        select(Task).join(task_notes, task_notes.c.task_id == Task.id).where(task_notes.c.note_id == note.id)
     )
     tasks = res.scalars().all()
     return [
@@ -463,12 +463,12 @@ async def attach_task_to_note(
     
     # check if already linked
     existing = await db.execute(
-        select(note_tasks.c.note_id).where(
-            note_tasks.c.note_id == note.id, note_tasks.c.task_id == task.id
+        select(task_notes.c.note_id).where(
+            task_notes.c.note_id == note.id, task_notes.c.task_id == task.id
         )
     )
     if existing.first() is None:
-        await db.execute(note_tasks.insert().values(note_id=note.id, task_id=task.id))
+        await db.execute(task_notes.insert().values(note_id=note.id, task_id=task.id))
         await db.commit()
     return None
 
@@ -484,7 +484,7 @@ async def detach_task_from_note(
     task = await _get_owned_task_or_404(db, current_user.id, task_id)
     
     await db.execute(
-        note_tasks.delete().where(note_tasks.c.note_id == note.id, note_tasks.c.task_id == task.id)
+        task_notes.delete().where(task_notes.c.note_id == note.id, task_notes.c.task_id == task.id)
     )
     await db.commit()
     return None
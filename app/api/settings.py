@@ -23,9 +23,8 @@ async def get_default_node(
     """Get the current user's default node"""
     try:
         logger.info(f"Getting default node for user {current_user.id}")
-        stmt = select(DefaultNode).where(DefaultNode.owner_id == current_user.id)
-        result = await db.execute(stmt)
-        default_node = result.scalar_one_or_none()
+        # Loaded together with the user row (User.default_node is lazy="joined")
+        default_node = current_user.default_node
         
         if default_node:
             logger.info(f"Found default node: {default_node.node_id}")
@@ -71,9 +70,7 @@ async def set_default_node(
                 raise HTTPException(status_code=404, detail="Node not found")
         
         # Check if user already has a default node record
-        stmt = select(DefaultNode).where(DefaultNode.owner_id == current_user.id)
-        result = await db.execute(stmt)
-        existing_default = result.scalar_one_or_none()
+        existing_default = current_user.default_node
         logger.info(f"Existing default: {existing_default}")
         
         if node_id_str:
@@ -1,3 +1,4 @@
+import uuid
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -5,9 +6,8 @@ from typing import List, Optional
 from sqlalchemy.exc import IntegrityError
 
 from app.db.deps import get_db
-from app.api.auth import get_current_user
+from app.api.auth import get_current_user_id
 from app.models.tag import Tag
-from app.models.user import User
 from app.schemas.tag import TagCreate, TagUpdate
 
 
@@ -20,11 +20,11 @@ async def list_tags(
     limit: int = Query(50, le=100, description="Maximum number of results"),
     offset: int = Query(0, ge=0, description="Offset for pagination"),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user_id: uuid.UUID = Depends(get_current_user_id)
 ):
     """List all tags for the current user with optional search filtering"""
     
-    query = select(Tag).where(Tag.owner_id == current_user.id)
+    query = select(Tag).where(Tag.owner_id == current_user_id)
     
     if q:
         query = query.where(Tag.name.ilike(f"%{q}%"))
@@ -50,13 +50,13 @@ async def list_tags(
 async def create_tag(
     tag_data: TagCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user_id: uuid.UUID = Depends(get_current_user_id)
 ):
     """Create a new tag or return existing one if it already exists"""
 
     # Check if tag already exists
     existing_query = select(Tag).where(
-        Tag.owner_id == current_user.id,
+        Tag.owner_id == current_user_id,
         Tag.name == tag_data.name
     )
     result = await db.execute(existing_query)
@@ -75,7 +75,7 @@ async def create_tag(
     # Create new tag (color validation already done by Pydantic)
     try:
         tag = Tag(
-            owner_id=current_user.id,
+            owner_id=current_user_id,
             name=tag_data.name.strip(),
             description=tag_data.description.strip() if tag_data.description else None,
             color=tag_data.color
@@ -105,13 +105,13 @@ async def search_tags(
     q: str = Query(..., min_length=1, description="Search query"),
     limit: int = Query(20, le=50, description="Maximum number of results"),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user_id: uuid.UUID = Depends(get_current_user_id)
 ):
     """Search tags by name for autocomplete functionality"""
     
     # Search for tags starting with the query (for autocomplete)
     query = select(Tag).where(
-        Tag.owner_id == current_user.id,
+        Tag.owner_id == current_user_id,
         Tag.name.ilike(f"{q}%")
     ).order_by(Tag.name).limit(limit)
     
@@ -133,7 +133,7 @@ async def search_tags(
 async def get_tag(
     tag_id: str,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user_id: uuid.UUID = Depends(get_current_user_id)
 ):
     """Get a specific tag by ID"""
 
@@ -145,7 +145,7 @@ async def get_tag(
 
     query = select(Tag).where(
         Tag.id == tag_uuid,
-        Tag.owner_id == current_user.id
+        Tag.owner_id == current_user_id
     )
     result = await db.execute(query)
     tag = result.scalar_one_or_none()
@@ -168,7 +168,7 @@ async def update_tag(
     tag_id: str,
     tag_data: TagUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user_id: uuid.UUID = Depends(get_current_user_id)
 ):
     """Update an existing tag. If renaming to an existing tag name, merges the tags."""
     from app.models.node_associations import node_tags
@@ -183,7 +183,7 @@ async def update_tag(
     # Get existing tag
     query = select(Tag).where(
         Tag.id == tag_uuid,
-        Tag.owner_id == current_user.id
+        Tag.owner_id == current_user_id
     )
     result = await db.execute(query)
     tag = result.scalar_one_or_none()
@@ -197,7 +197,7 @@ async def update_tag(
         
         # Check if a tag with the new name already exists
         existing_query = select(Tag).where(
-            Tag.owner_id == current_user.id,
+            Tag.owner_id == current_user_id,
             Tag.name == new_name,
             Tag.id != tag_uuid
         )
@@ -209,6 +209,7 @@ async def update_tag(
             
             # Get all nodes tagged with the current tag
             current_associations_query = select(node_tags.c.node_id).where(
+                node_tags.c.owner_id == current_user_id,
                 node_tags.c.tag_id == tag.id
             )
             current_result = await db.execute(current_associations_query)
@@ -217,6 +218,7 @@ async def update_tag(
             if current_node_ids:
                 # Get nodes already tagged with the existing tag to avoid duplicates
                 existing_associations_query = select(node_tags.c.node_id).where(
+                    node_tags.c.owner_id == current_user_id,
                     node_tags.c.tag_id == existing_tag.id,
                     node_tags.c.node_id.in_(current_node_ids)
                 )
@@ -229,14 +231,17 @@ async def update_tag(
                 if nodes_to_move:
                     # Add associations to the existing tag
                     associations_to_add = [
-                        {"node_id": node_id, "tag_id": existing_tag.id}
+                        {"owner_id": current_user_id, "node_id": node_id, "tag_id": existing_tag.id}
                         for node_id in nodes_to_move
                     ]
                     await db.execute(insert(node_tags).values(associations_to_add))
                 
                 # Delete all associations with the current tag
                 await db.execute(
-                    sql_delete(node_tags).where(node_tags.c.tag_id == tag.id)
+                    sql_delete(node_tags).where(
+                        node_tags.c.owner_id == current_user_id,
+                        node_tags.c.tag_id == tag.id,
+                    )
                 )
             
             # Delete the current tag
@@ -279,7 +284,7 @@ async def update_tag(
 async def delete_tag(
     tag_id: str,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user_id: uuid.UUID = Depends(get_current_user_id)
 ):
     """Delete a tag and all its node associations"""
 
@@ -292,7 +297,7 @@ async def delete_tag(
     # Get existing tag
     query = select(Tag).where(
         Tag.id == tag_uuid,
-        Tag.owner_id == current_user.id
+        Tag.owner_id == current_user_id
     )
     result = await db.execute(query)
     tag = result.scalar_one_or_none()
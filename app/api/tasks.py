@@ -1,7 +1,8 @@
 import uuid
 from datetime import datetime, timezone
 from fastapi import APIRouter, Depends, HTTPException, status, Response
-from sqlalchemy import select, asc, desc, func
+from sqlalchemy import select, asc, desc, func, exists
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.deps import get_db
@@ -46,16 +47,24 @@ async def _get_or_create_default_list_id(db: AsyncSession, owner_id: uuid.UUID)
     res = await db.execute(select(TaskList.id).where(TaskList.owner_id == owner_id, TaskList.is_system_root == True))
     root_id = res.scalar_one_or_none()
     if root_id is None:
-        # create a system root if somehow missing
+        # create a system root if somehow missing; flush only, committed with the mapping below
         root = TaskList(owner_id=owner_id, name="__ROOT__", description="System root", is_system_root=True)
         db.add(root)
-        await db.commit()
-        await db.refresh(root)
+        await db.flush()
         root_id = root.id
-    # insert mapping
-    db.add(DefaultTaskList(user_id=owner_id, task_list_id=root_id))
+    # insert mapping, tolerating a concurrent bootstrap for the same user
+    res = await db.execute(
+        pg_insert(DefaultTaskList)
+        .values(user_id=owner_id, task_list_id=root_id)
+        .on_conflict_do_nothing(index_elements=[DefaultTaskList.user_id])
+        .returning(DefaultTaskList.task_list_id)
+    )
+    tl_id = res.scalar_one_or_none()
+    if tl_id is None:
+        res = await db.execute(select(DefaultTaskList.task_list_id).where(DefaultTaskList.user_id == owner_id))
+        tl_id = res.scalar_one()
     await db.commit()
-    return root_id
+    return tl_id
 
 
 class TaskCreateInDefault(BaseModel):
@@ -305,12 +314,10 @@ async def attach_tag(
 
     # upsert-ish: check existence then insert
     res = await db.execute(
-        select(task_tags.c.task_id).where(
-            task_tags.c.task_id == task.id, task_tags.c.tag_id == tag.id
-        )
+        select(exists().where(task_tags.c.task_id == task.id, task_tags.c.tag_id == tag.id))
     )
-    exists_row = res.first()
-    if not exists_row:
+    already = res.scalar()
+    if not already:
         await db.execute(task_tags.insert().values(task_id=task.id, tag_id=tag.id))
         await db.commit()
     return None
@@ -504,11 +511,9 @@ async def attach_note_to_task(
     
     # check if already linked
     existing = await db.execute(
-        select(task_notes.c.task_id).where(
-            task_notes.c.task_id == task.id, task_notes.c.note_id == note.id
-        )
+        select(exists().where(task_notes.c.task_id == task.id, task_notes.c.note_id == note.id))
     )
-    if existing.first() is None:
+    if not existing.scalar():
         await db.execute(task_notes.insert().values(task_id=task.id, note_id=note.id))
         await db.commit()
     return None
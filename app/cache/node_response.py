@@ -0,0 +1,25 @@
+"""
+In-process cache of built node responses.
+
+A node's own columns only change together with its updated_at (see the
+before_update hook in app.models.node), so (id, updated_at) identifies one
+immutable response. Tags and child counts change without touching the node
+row; callers overlay those per request.
+"""
+from app.cache.lru import LRUCache
+
+
+node_response_cache = LRUCache(maxsize=50_000)
+
+
+def node_cache_key(node) -> tuple:
+    return (node.id, node.updated_at)
+
+
+def with_request_fields(response, children_count: int, tags: list):
+    """Copy a cached response with this request's tags and child counts"""
+    return response.model_copy(update={
+        "is_list": children_count > 0,
+        "children_count": children_count,
+        "tags": tags,
+    })
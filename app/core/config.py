@@ -9,6 +9,13 @@ class Settings(BaseSettings):
     env: str = "development"
     database_url: str
 
+    # Connection pool
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_statement_timeout_ms: int = 60000
+    # Per-connection asyncpg prepared statements (server-side parse/plan reused)
+    db_prepared_statement_cache_size: int = 1024
+
     # Auth/JWT
     jwt_secret: str = "dev-secret-change-me"
     access_token_expire_minutes: int = 43200
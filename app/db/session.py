@@ -22,10 +22,21 @@ engine: AsyncEngine = create_async_engine(
     _settings.database_url,
     echo=False,
     pool_pre_ping=True,
-    pool_size=5,        # tune to your workload
-    max_overflow=10,    # extra above pool_size
+    pool_size=_settings.db_pool_size,          # tune to your workload
+    max_overflow=_settings.db_max_overflow,    # extra above pool_size
     pool_timeout=30,
-    pool_recycle=1800,  # recycle stale conns (secs)
+    pool_recycle=3600,  # recycle stale conns (secs)
+    connect_args={
+        # Statements come from cached lambda_stmt/compiled SQL, so the same text
+        # repeats per filter combination; keep enough prepared per connection
+        # that the hot variants are never evicted and re-planned.
+        "prepared_statement_cache_size": _settings.db_prepared_statement_cache_size,
+        "server_settings": {
+            "statement_timeout": str(_settings.db_statement_timeout_ms),
+            # JIT compilation costs more than it saves on short OLTP queries
+            "jit": "off",
+        }
+    },
 )
 
 # ---- Create ONE sessionmaker tied to that engine ----
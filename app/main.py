@@ -1,5 +1,7 @@
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
@@ -8,6 +10,7 @@ import os
 
 from app.core.config import get_settings
 from app.db.session import get_engine
+from app.schemas.node import warm_deferred_schemas
 from app.api.health import router as health_router
 from app.api.auth import router as auth_router
 from app.api.nodes import router as nodes_router
@@ -25,6 +28,8 @@ from app.api.artifacts import router as artifacts_router
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # Compile the deferred Pydantic schemas in a worker thread while the DB check runs
+    warm_schemas = asyncio.create_task(run_in_threadpool(warm_deferred_schemas))
     # Optional: check DB connectivity on startup
     engine = get_engine()
     try:
@@ -32,6 +37,7 @@ async def lifespan(app: FastAPI):
             await conn.execute(text("SELECT 1"))
     except Exception:  # Leave startup resilient; health endpoint will still show issues
         pass
+    await warm_schemas
     yield
 
 
@@ -1,3 +1,5 @@
+from sqlalchemy.orm import selectin_polymorphic
+
 from app.db.session import Base
 
 # Import models to register them with SQLAlchemy metadata
@@ -5,12 +7,17 @@ from .user import User  # noqa: F401
 from .tag import Tag  # noqa: F401
 
 # New unified models
-from .node import Node, Task, Note, SmartFolder, Folder  # noqa: F401
+from .node import Node, Task, Note, SmartFolder, Folder, Template  # noqa: F401
 from .node_associations import node_tags  # noqa: F401
 from .default_node import DefaultNode  # noqa: F401
 from .rule import Rule  # noqa: F401
 from .artifact import Artifact  # noqa: F401
 
+# Loads subtype columns with one IN query per subtype present in a result,
+# instead of outer-joining every subtype table into each row. Built here, once
+# every mapped class is imported, since building it configures the mappers.
+NODE_SUBTYPES_LOADER = selectin_polymorphic(Node, [Task, Note, SmartFolder, Template, Folder])
+
 # Legacy models - disabled to avoid naming conflicts during migration
 # from .task_list import TaskList  # noqa: F401
 # from .task import Task as LegacyTask  # noqa: F401
@@ -37,4 +44,5 @@ __all__ = [
     "DefaultNode",
     "Artifact",
     "node_tags",
+    "NODE_SUBTYPES_LOADER",
 ]
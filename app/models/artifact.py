@@ -1,15 +1,16 @@
 import uuid
-from sqlalchemy import String, Text, DateTime, func, ForeignKey, BigInteger
+from sqlalchemy import String, Text, DateTime, func, ForeignKey, BigInteger, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.session import Base
+from app.utils.uuid7 import gen_uuid_v7
 
 
 class Artifact(Base):
     __tablename__ = "artifacts"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=gen_uuid_v7, server_default=text("gen_uuid_v7()"))
     node_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("nodes.id", ondelete="CASCADE"), nullable=False, index=True)
     filename: Mapped[str] = mapped_column(String(255), nullable=False)
     original_filename: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -18,4 +19,12 @@ class Artifact(Base):
     size_bytes: Mapped[int] = mapped_column(BigInteger, nullable=False)
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
-    node = relationship("Node", back_populates="artifacts")
\ No newline at end of file
+    node = relationship("Node", back_populates="artifacts")
+
+
+Index(
+    "ix_artifact_node_created",
+    Artifact.node_id,
+    Artifact.created_at,
+    postgresql_include=["filename", "size_bytes"],
+)
@@ -4,6 +4,11 @@ from sqlalchemy.dialects.postgresql import UUID
 
 from app.db.session import Base
 
+# Legacy per-entity association tables. The unified node system stores every
+# node/tag link in the single node_tags table (app.models.node_associations);
+# these remain only for the disabled TaskList/NoteList/TagList modules.
+# Task <-> Note links live in task_notes alone (note_tasks was a mirror of it).
+
 
 task_tags = Table(
     "task_tags",
@@ -33,13 +38,6 @@ note_links = Table(
     Column("target_note_id", UUID(as_uuid=True), ForeignKey("notes.id", ondelete="CASCADE"), primary_key=True),
 )
 
-note_tasks = Table(
-    "note_tasks",
-    Base.metadata,
-    Column("note_id", UUID(as_uuid=True), ForeignKey("notes.id", ondelete="CASCADE"), primary_key=True),
-    Column("task_id", UUID(as_uuid=True), ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True),
-)
-
 tag_notes = Table(
     "tag_notes",
     Base.metadata,
@@ -1,4 +1,4 @@
-from enum import Enum
+from enum import Enum, IntEnum
 
 
 class TaskStatus(str, Enum):
@@ -15,4 +15,30 @@ class TaskPriority(str, Enum):
     urgent = "urgent"
 
 
+class TaskStatusCode(IntEnum):
+    """Storage codes for Task.status (persisted as SMALLINT)"""
+    todo = 0
+    in_progress = 1
+    done = 2
+    dropped = 3
 
+
+class TaskPriorityCode(IntEnum):
+    """Storage codes for Task.priority (persisted as SMALLINT); ordered low to urgent"""
+    low = 0
+    medium = 1
+    high = 2
+    urgent = 3
+
+
+
+
+
+class NodeType(IntEnum):
+    """Storage codes for Node.node_type (persisted as SMALLINT)"""
+    node = 0
+    task = 1
+    note = 2
+    folder = 3
+    smart_folder = 4
+    template = 5
@@ -1,5 +1,6 @@
 import uuid
 from sqlalchemy import (
+    Column,
     String,
     Text,
     Integer,
@@ -7,39 +8,57 @@ from sqlalchemy import (
     DateTime,
     func,
     ForeignKey,
-    Enum,
     Index,
-    JSON,
+    CheckConstraint,
     text,
+    event,
 )
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.orm import Mapped, column_property, mapped_column, relationship, object_session
 
 from app.db.session import Base
-from .enums import TaskPriority, TaskStatus
+from app.utils.uuid7 import gen_uuid_v7
+from .enums import NodeType, TaskPriority, TaskPriorityCode, TaskStatus, TaskStatusCode
+from .types import LTree, SmallIntCodedEnum, SmallIntEnumName
 
 
 class Node(Base):
     """Base node class for polymorphic inheritance"""
     __tablename__ = "nodes"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=gen_uuid_v7, server_default=text("gen_uuid_v7()"))
     owner_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="RESTRICT"), nullable=False, index=True)
     parent_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("nodes.id", ondelete="CASCADE"), nullable=True, index=True)
-    node_type: Mapped[str] = mapped_column(String(20), nullable=False)
+    node_type: Mapped[str] = mapped_column(SmallIntEnumName(NodeType), nullable=False)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     sort_order: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Materialized ancestor path (root...self, one label per node id), maintained by
+    # the nodes_path triggers. Only used inside SQL, so never loaded by default.
+    path: Mapped[str] = mapped_column(LTree(), nullable=False, server_default=text("''"), deferred=True)
+    # Maintained by the nodes_child_count trigger (see migration b7e1d4a9c2f3)
+    child_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
     # Relationships
     owner = relationship("User", back_populates="nodes")
     parent = relationship("Node", remote_side="Node.id", back_populates="children")
-    children = relationship("Node", back_populates="parent", cascade="all, delete-orphan")
-    tags = relationship("Tag", secondary="node_tags", back_populates="nodes")
-    artifacts = relationship("Artifact", back_populates="node", cascade="all, delete-orphan")
+    # Collections must be loaded explicitly (selectinload / batched queries);
+    # an accidental lazy load in a serialization loop raises instead of issuing N selects.
+    children = relationship("Node", back_populates="parent", cascade="all, delete-orphan", lazy="raise_on_sql")
+    # node_tags rows carry the owner_id partition key, so they are written with
+    # explicit inserts rather than through this collection.
+    tags = relationship("Tag", secondary="node_tags", back_populates="nodes", lazy="raise_on_sql", viewonly=True)
+    artifacts = relationship(
+        "Artifact",
+        back_populates="node",
+        cascade="all, delete-orphan",
+        order_by="Artifact.created_at",
+        lazy="raise_on_sql",
+    )
 
-    # Polymorphic configuration
+    # Polymorphic configuration. Subtype columns are loaded per query with
+    # selectin_polymorphic (see app.models.NODE_SUBTYPES_LOADER).
     __mapper_args__ = {
         "polymorphic_on": node_type,
         "polymorphic_identity": "node"
@@ -48,7 +67,7 @@ class Node(Base):
     @property
     def is_list(self) -> bool:
         """A node becomes a list when it has children"""
-        return len(self.children) > 0
+        return self.child_count > 0
 
     def __repr__(self):
         return f"<Node(id={self.id}, type={self.node_type}, title='{self.title}')>"
@@ -57,17 +76,27 @@ class Node(Base):
 class Task(Node):
     """Task node - inherits from Node"""
     __tablename__ = "node_tasks"
+    __table_args__ = (
+        CheckConstraint(f"status BETWEEN 0 AND {max(TaskStatusCode)}", name="ck_node_tasks_status_code"),
+        CheckConstraint(f"priority BETWEEN 0 AND {max(TaskPriorityCode)}", name="ck_node_tasks_priority_code"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("nodes.id"), primary_key=True)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
-    status: Mapped[TaskStatus] = mapped_column(Enum(TaskStatus, name="task_status", native_enum=True), nullable=False, default=TaskStatus.todo)
-    priority: Mapped[TaskPriority] = mapped_column(Enum(TaskPriority, name="task_priority", native_enum=True), nullable=False, default=TaskPriority.medium)
+    status: Mapped[TaskStatus] = mapped_column(SmallIntCodedEnum(TaskStatus, TaskStatusCode), nullable=False, default=TaskStatus.todo)
+    priority: Mapped[TaskPriority] = mapped_column(SmallIntCodedEnum(TaskPriority, TaskPriorityCode), nullable=False, default=TaskPriority.medium)
     due_at: Mapped[DateTime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     earliest_start_at: Mapped[DateTime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     completed_at: Mapped[DateTime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     archived: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     recurrence_rule: Mapped[str | None] = mapped_column(Text, nullable=True)
     recurrence_anchor: Mapped[DateTime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Copy of nodes.owner_id, written through the same attribute, so per-owner
+    # date filters are a single range scan on node_tasks (ix_task_owner_due, ...)
+    owner_id: Mapped[uuid.UUID] = column_property(
+        Column("owner_id", UUID(as_uuid=True), ForeignKey("users.id", ondelete="RESTRICT"), nullable=False),
+        Node.owner_id,
+    )
 
     __mapper_args__ = {"polymorphic_identity": "task"}
 
@@ -103,7 +132,7 @@ class SmartFolder(Node):
     
     # Legacy column - will be removed after migration
     rules: Mapped[dict | None] = mapped_column(
-        JSON, 
+        JSONB, 
         nullable=True, 
         default=lambda: {"conditions": [], "logic": "AND"},
         comment="DEPRECATED - Use rule_id instead"
@@ -158,10 +187,54 @@ class Folder(Node):
         return f"<Folder(id={self.id}, title='{self.title}')>"
 
 
+@event.listens_for(Node, "before_update", propagate=True)
+def _touch_updated_at(mapper, connection, target):
+    # onupdate only fires when the nodes row itself is updated. Subtype-only
+    # edits (task status, note body, ...) must bump updated_at as well, since
+    # (id, updated_at) keys the response cache in app.cache.node_response.
+    if object_session(target).is_modified(target, include_collections=False):
+        target.updated_at = func.now()
+
+
 # Useful indexes
-Index("ix_node_owner_sort", Node.owner_id, Node.sort_order)
-Index("ix_node_parent", Node.parent_id)
+Index(
+    "ix_node_owner_sort_covering",
+    Node.owner_id,
+    Node.sort_order,
+    postgresql_include=["title", "node_type", "parent_id"],
+)
+# Children of a node in listing order (WHERE parent_id = ? ORDER BY sort_order, created_at)
+Index("ix_node_parent_sort", Node.parent_id, Node.sort_order, Node.created_at)
+# Owner-scoped base filters of SmartFolderRulesEngine (parent_node conditions)
+Index("ix_node_owner_parent", Node.owner_id, Node.parent_id)
+# Smart folder base query shape (owner, type/parent conditions), templates excluded
+Index(
+    "ix_node_owner_type_parent",
+    Node.owner_id,
+    Node.node_type,
+    Node.parent_id,
+    postgresql_where=text(f"node_type <> {int(NodeType.template)}"),
+)
 Index("ix_node_type", Node.node_type)
-Index("ix_task_status", Task.status)
-Index("ix_task_priority", Task.priority)
-Index("ix_task_due_at", Task.due_at)
\ No newline at end of file
+# Trigram index for substring title search (lower(title) LIKE '%...%'); needs pg_trgm
+Index(
+    "ix_node_title_trgm",
+    func.lower(Node.title).label("title_lower"),
+    postgresql_using="gin",
+    postgresql_ops={"title_lower": "gin_trgm_ops"},
+)
+Index("ix_node_is_list", Node.parent_id, postgresql_where=text("child_count > 0"))
+Index("ix_node_path_gist", Node.path, postgresql_using="gist")
+Index("ix_task_status_priority", Task.status, Task.priority)
+# Open tasks only; archived/done rows are rarely queried and would bloat a full index
+Index(
+    "ix_task_active",
+    Task.priority,
+    Task.due_at,
+    postgresql_where=text(f"archived = false AND status <> {int(TaskStatusCode.done)}"),
+)
+# Per-owner date conditions of smart folders (node_tasks carries its own owner_id)
+Index("ix_task_owner_due", Task.__table__.c.owner_id, Task.due_at)
+Index("ix_task_owner_earliest_start", Task.__table__.c.owner_id, Task.earliest_start_at)
+Index("ix_task_due_soon", Task.due_at, postgresql_where=text("due_at IS NOT NULL AND archived = false"))
+Index("ix_task_status_due", Task.status, Task.due_at, postgresql_where=text("archived = false"))
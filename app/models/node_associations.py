@@ -1,12 +1,34 @@
-from sqlalchemy import Table, Column, ForeignKey
+from sqlalchemy import DDL, Table, Column, ForeignKey, Index, event
 from sqlalchemy.dialects.postgresql import UUID
 
 from app.db.session import Base
 
 
+# Number of hash partitions for node_tags (must match migration e7a3c9d1b5f2)
+NODE_TAGS_PARTITIONS = 16
+
+# Partitioned by owner so a user's tag lookups only touch one partition.
+# owner_id is the node's owner; writers must supply it (Postgres routes the row
+# to its partition before any trigger could fill it in).
 node_tags = Table(
     "node_tags",
     Base.metadata,
+    Column("owner_id", UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
     Column("node_id", UUID(as_uuid=True), ForeignKey("nodes.id", ondelete="CASCADE"), primary_key=True),
     Column("tag_id", UUID(as_uuid=True), ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True),
-)
\ No newline at end of file
+    postgresql_partition_by="HASH (owner_id)",
+)
+
+# Tag -> nodes lookups (smart folder tag_contains, tag merge/delete); the primary
+# key leads with node_id after owner_id and cannot serve them
+Index("ix_node_tags_tag_node", node_tags.c.tag_id, node_tags.c.node_id)
+
+for _remainder in range(NODE_TAGS_PARTITIONS):
+    event.listen(
+        node_tags,
+        "after_create",
+        DDL(
+            f"CREATE TABLE node_tags_p{_remainder} PARTITION OF node_tags "
+            f"FOR VALUES WITH (MODULUS {NODE_TAGS_PARTITIONS}, REMAINDER {_remainder})"
+        ).execute_if(dialect="postgresql"),
+    )
@@ -4,7 +4,8 @@ from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.session import Base
-from app.models.associations import tag_notes, note_links, note_tasks, tag_notes as tag_notes_assoc, task_notes
+from app.utils.uuid7 import gen_uuid_v7
+from app.models.associations import tag_notes, note_links, task_notes
 
 
 class Note(Base):
@@ -16,7 +17,7 @@ class Note(Base):
         ),
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=gen_uuid_v7)
     note_list_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("note_lists.id", ondelete="CASCADE"), nullable=False, index=True)
     parent_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("notes.id", ondelete="CASCADE"), nullable=True, index=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -30,21 +31,30 @@ class Note(Base):
     children = relationship("Note", back_populates="parent", cascade="all, delete-orphan")
     
     tags = relationship("Tag", secondary=tag_notes, back_populates="notes")
-    contained_tasks = relationship("Task", secondary=note_tasks, back_populates="containing_notes")
     containing_tasks = relationship("Task", secondary=task_notes, back_populates="contained_notes")
-    containing_tags = relationship("Tag", secondary=tag_notes, back_populates="contained_notes")
     
+    # Link edges as NoteLink rows, batch-loaded with one IN query per direction
     linked_to = relationship(
-        "Note",
-        secondary=note_links,
-        primaryjoin="Note.id == note_links.c.source_note_id",
-        secondaryjoin="Note.id == note_links.c.target_note_id",
-        back_populates="linked_from"
+        "NoteLink",
+        primaryjoin="Note.id == NoteLink.source_note_id",
+        back_populates="source",
+        lazy="selectin",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     linked_from = relationship(
-        "Note",
-        secondary=note_links,
-        primaryjoin="Note.id == note_links.c.target_note_id",
-        secondaryjoin="Note.id == note_links.c.source_note_id",
-        back_populates="linked_to"
+        "NoteLink",
+        primaryjoin="Note.id == NoteLink.target_note_id",
+        back_populates="target",
+        lazy="selectin",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
+
+
+class NoteLink(Base):
+    """Directed link between two notes (maps the note_links table)"""
+    __table__ = note_links
+
+    source = relationship("Note", foreign_keys=[note_links.c.source_note_id], back_populates="linked_to")
+    target = relationship("Note", foreign_keys=[note_links.c.target_note_id], back_populates="linked_from")
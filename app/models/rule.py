@@ -8,13 +8,15 @@ from sqlalchemy import (
     DateTime,
     func,
     ForeignKey,
-    JSON,
     Boolean,
+    Index,
+    text,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.session import Base
+from app.utils.uuid7 import gen_uuid_v7
 
 
 class Rule(Base):
@@ -29,7 +31,8 @@ class Rule(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), 
         primary_key=True, 
-        default=uuid.uuid4
+        default=gen_uuid_v7,
+        server_default=text("gen_uuid_v7()")
     )
     
     owner_id: Mapped[uuid.UUID] = mapped_column(
@@ -53,7 +56,7 @@ class Rule(Base):
     
     # Rule definition
     rule_data: Mapped[dict] = mapped_column(
-        JSON, 
+        JSONB, 
         nullable=False, 
         default=lambda: {"conditions": [], "logic": "AND"},
         comment="JSON structure containing conditions and logic"
@@ -105,4 +108,13 @@ class Rule(Base):
         }
     
     def __repr__(self):
-        return f"<Rule(id={self.id}, name='{self.name}')>"
\ No newline at end of file
+        return f"<Rule(id={self.id}, name='{self.name}')>"
+
+
+# Containment lookups on rule definitions (rule_data @> '{...}')
+Index(
+    "ix_rules_data_gin",
+    Rule.rule_data,
+    postgresql_using="gin",
+    postgresql_ops={"rule_data": "jsonb_path_ops"},
+)
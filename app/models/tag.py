@@ -1,9 +1,11 @@
 import uuid
-from sqlalchemy import String, Text, DateTime, func, ForeignKey, UniqueConstraint, Integer
+from sqlalchemy import String, Text, DateTime, func, ForeignKey, UniqueConstraint, Integer, text
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.hybrid import Comparator, hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.session import Base
+from app.utils.uuid7 import gen_uuid_v7
 from app.models.node_associations import node_tags
 
 
@@ -13,14 +15,47 @@ class Tag(Base):
         UniqueConstraint("owner_id", "name", name="uq_tag_owner_name"),
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=gen_uuid_v7, server_default=text("gen_uuid_v7()"))
     owner_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="RESTRICT"), nullable=False, index=True)
     name: Mapped[str] = mapped_column(String(64), nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
-    color: Mapped[str | None] = mapped_column(String(7), nullable=True)  # Hex color code
+    # Stored as a packed 0xRRGGBB integer; exposed as "#rrggbb" through Tag.color
+    color_value: Mapped[int | None] = mapped_column("color", Integer, nullable=True)
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
     # Unified node system relationships
     owner = relationship("User", back_populates="tags")
-    nodes = relationship("Node", secondary=node_tags, back_populates="tags")
+    nodes = relationship("Node", secondary=node_tags, back_populates="tags", viewonly=True)
+
+    @hybrid_property
+    def color(self) -> str | None:
+        """Hex color code (#rrggbb)"""
+        if self.color_value is None:
+            return None
+        return f"#{self.color_value:06x}"
+
+    @color.inplace.setter
+    def _color_setter(self, value: str | None) -> None:
+        self.color_value = _pack_color(value)
+
+    @color.inplace.comparator
+    @classmethod
+    def _color_comparator(cls) -> "_HexColorComparator":
+        return _HexColorComparator(cls.color_value)
+
+
+def _pack_color(value):
+    """'#rrggbb' -> 0xRRGGBB; empty string clears the color, same as None"""
+    if isinstance(value, str):
+        return int(value.lstrip("#"), 16) if value else None
+    if isinstance(value, (list, tuple)):
+        return [_pack_color(v) for v in value]
+    return value
+
+
+class _HexColorComparator(Comparator):
+    """Compares Tag.color against hex strings by packing them like the setter"""
+
+    def operate(self, op, *other, **kwargs):
+        return op(self.__clause_element__(), *(_pack_color(o) for o in other), **kwargs)
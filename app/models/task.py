@@ -9,18 +9,20 @@ from sqlalchemy import (
     ForeignKey,
     Enum,
     Index,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.session import Base
+from app.utils.uuid7 import gen_uuid_v7
 from .enums import TaskPriority, TaskStatus
 
 
 class Task(Base):
     __tablename__ = "tasks"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=gen_uuid_v7)
     list_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("task_lists.id", ondelete="CASCADE"), index=True, nullable=False)
     parent_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("tasks.id", ondelete="CASCADE"), index=True, nullable=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -45,14 +47,25 @@ class Task(Base):
     parent = relationship("Task", remote_side="Task.id", back_populates="children")
     children = relationship("Task", back_populates="parent", cascade="all, delete-orphan")
 
-    tags = relationship("Tag", secondary="task_tags", back_populates="tasks")
+    # Almost always rendered with the task: batch-load with one IN query per result
+    tags = relationship("Tag", secondary="task_tags", back_populates="tasks", lazy="selectin")
+    # Load explicitly at query sites with selectinload(...). task_notes holds a
+    # single undirected set of links, so one relationship per side is enough.
     contained_notes = relationship("Note", secondary="task_notes", back_populates="containing_tasks")
-    containing_notes = relationship("Note", secondary="task_notes", back_populates="contained_tasks")
-    artifacts = relationship("Artifact", back_populates="task", cascade="all, delete-orphan")
 
 
 # Useful indexes
-Index("ix_task_list_sort", Task.list_id, Task.sort_order)
+Index("ix_task_list_sort_id", Task.list_id, Task.sort_order, Task.id)
+Index("ix_task_list_status_due", Task.list_id, Task.status, Task.due_at)
+Index("ix_task_list_archived_sort", Task.list_id, Task.archived, Task.sort_order)
 Index("ix_task_status", Task.status)
 Index("ix_task_priority", Task.priority)
-Index("ix_task_due_at", Task.due_at)
+# Open tasks only; archived/done rows are rarely queried and would bloat a full index
+Index(
+    "ix_tasks_active",
+    Task.list_id,
+    Task.priority,
+    Task.due_at,
+    postgresql_where=text("archived = false AND status <> 'done'"),
+)
+Index("ix_tasks_due_soon", Task.due_at, postgresql_where=text("due_at IS NOT NULL AND archived = false"))
@@ -4,6 +4,7 @@ from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.session import Base
+from app.utils.uuid7 import gen_uuid_v7
 from app.models.associations import list_tags
 
 
@@ -18,7 +19,7 @@ class TaskList(Base):
         ),
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=gen_uuid_v7)
     owner_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="RESTRICT"), nullable=False, index=True)
     parent_list_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("task_lists.id", ondelete="CASCADE"), nullable=True, index=True)
     # Invisible per-user system root flag
@@ -33,5 +34,4 @@ class TaskList(Base):
     parent = relationship("TaskList", remote_side="TaskList.id", back_populates="children")
     children = relationship("TaskList", back_populates="parent", cascade="all, delete-orphan")
     tasks = relationship("Task", back_populates="list", cascade="all, delete-orphan")
-    artifacts = relationship("Artifact", back_populates="list", cascade="all, delete-orphan")
     tags = relationship("Tag", secondary=list_tags, back_populates="lists")
@@ -0,0 +1,72 @@
+from enum import Enum, IntEnum
+from typing import Type
+
+from sqlalchemy import SmallInteger
+from sqlalchemy.types import TypeDecorator, UserDefinedType
+
+
+class SmallIntEnumName(TypeDecorator):
+    """Persist an IntEnum as SMALLINT while exposing member names in Python.
+
+    Application code keeps comparing against plain strings ("task", "note", ...)
+    and polymorphic identities stay strings; only the stored value shrinks.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class: Type[IntEnum], *args, **kwargs):
+        self.enum_class = enum_class
+        super().__init__(*args, **kwargs)
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, self.enum_class):
+            return int(value)
+        try:
+            return int(self.enum_class[value])
+        except KeyError:
+            raise ValueError(f"Unknown {self.enum_class.__name__}: {value!r}")
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return self.enum_class(value).name
+
+
+class SmallIntCodedEnum(SmallIntEnumName):
+    """Persist a str Enum as SMALLINT through a parallel IntEnum of storage codes.
+
+    Binds accept enum members or their names; results come back as members of
+    ``enum_class`` (e.g. TaskStatus), so callers keep the string enum semantics.
+    """
+
+    cache_ok = True
+
+    def __init__(self, enum_class: Type[Enum], code_class: Type[IntEnum], *args, **kwargs):
+        self.value_class = enum_class
+        super().__init__(code_class, *args, **kwargs)
+
+    def process_bind_param(self, value, dialect):
+        if isinstance(value, self.value_class):
+            value = value.name
+        return super().process_bind_param(value, dialect)
+
+    def process_result_value(self, value, dialect):
+        name = super().process_result_value(value, dialect)
+        return None if name is None else self.value_class[name]
+
+
+class LTree(UserDefinedType):
+    """PostgreSQL ltree label path (requires the ltree extension)."""
+
+    cache_ok = True
+
+    def get_col_spec(self, **kw):
+        return "LTREE"
+
+    class comparator_factory(UserDefinedType.Comparator):
+        def descendant_of(self, other):
+            """path <@ other: self is other or lies beneath it"""
+            return self.op("<@", is_comparison=True)(other)
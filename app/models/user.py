@@ -1,15 +1,16 @@
 import uuid
-from sqlalchemy import String, Boolean, DateTime, func
+from sqlalchemy import String, Boolean, DateTime, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.session import Base
+from app.utils.uuid7 import gen_uuid_v7
 
 
 class User(Base):
     __tablename__ = "users"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=gen_uuid_v7, server_default=text("gen_uuid_v7()"))
     email: Mapped[str] = mapped_column(String(320), unique=True, index=True, nullable=False)
     password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
     full_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
@@ -21,7 +22,8 @@ class User(Base):
     nodes = relationship("Node", back_populates="owner", cascade="all, delete-orphan")
     tags = relationship("Tag", back_populates="owner", cascade="all, delete-orphan")
     rules = relationship("Rule", back_populates="owner", cascade="all, delete-orphan")
-    default_node = relationship("DefaultNode", back_populates="owner", uselist=False, cascade="all, delete-orphan")
+    # One row per user; joined so the default comes back with every user fetch
+    default_node = relationship("DefaultNode", back_populates="owner", uselist=False, cascade="all, delete-orphan", lazy="joined")
     
     # Legacy relationships - disabled during migration
     # lists = relationship("TaskList", back_populates="owner", cascade="all, delete-orphan")
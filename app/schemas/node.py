@@ -1,8 +1,8 @@
 from datetime import datetime
-from typing import Optional, List, Union, Literal, Any
+from typing import Optional, List, Union, Literal, Any, Annotated
 from uuid import UUID
 
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter, field_validator
 from app.models.enums import TaskStatus, TaskPriority
 from app.schemas.tag import TagResponse
 
@@ -90,6 +90,8 @@ class FolderCreate(NodeCreate):
     node_type: Literal["folder"] = "folder"
     folder_data: Optional[FolderData] = None
 
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
+
 
 class FolderUpdate(NodeUpdate):
     """Schema for updating folders"""
@@ -99,12 +101,26 @@ class FolderUpdate(NodeUpdate):
 # Smart Folder-specific schemas
 class SmartFolderCondition(BaseModel):
     """Individual filter condition for smart folders"""
-    type: Literal["tag_contains", "node_type", "parent_node", "parent_ancestor", "task_status", "task_priority", "title_contains", "has_children"]
-    operator: Literal["equals", "in", "any", "all", "contains", "not_equals"]
-    values: List[str]
+    type: Literal[
+        "tag_contains", "node_type", "parent_node", "parent_ancestor", "task_status", "task_priority",
+        "title_contains", "has_children", "due_date", "earliest_start", "saved_filter"
+    ]
+    # Date conditions use many operators (is_today, due_within_days, between, ...);
+    # SmartFolderRulesEngine.validate_rules checks operator/values pairing
+    operator: str
+    values: List[str] = Field(default_factory=list)
 
     model_config = ConfigDict(from_attributes=True)
 
+    @field_validator('values', mode='before')
+    @classmethod
+    def numbers_to_str(cls, v):
+        # Day counts may be sent as JSON numbers ({"values": [7]}); the engine
+        # builders work on strings only
+        if isinstance(v, list):
+            return [str(x) if isinstance(x, (int, float)) and not isinstance(x, bool) else x for x in v]
+        return v
+
 
 class SmartFolderRules(BaseModel):
     """Rules schema for smart folder filtering"""
@@ -117,7 +133,7 @@ class SmartFolderRules(BaseModel):
 class SmartFolderData(BaseModel):
     """Smart folder-specific data"""
     rule_id: Optional[UUID] = None  # Reference to the rule this smart folder uses
-    rules: Optional[dict] = Field(None, deprecated=True, description="DEPRECATED - Use rule_id instead. Raw dict for JSON storage, kept for backward compatibility only.")
+    rules: Optional[SmartFolderRules] = Field(None, deprecated=True, description="DEPRECATED - Use rule_id instead. Inline rules, kept for backward compatibility only.")
     auto_refresh: Optional[bool] = None
     description: Optional[str] = None
 
@@ -164,6 +180,8 @@ class TemplateCreate(NodeCreate):
     node_type: Literal["template"] = "template"
     template_data: TemplateData = Field(default_factory=TemplateData)
 
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
+
 
 class TemplateUpdate(NodeUpdate):
     """Schema for updating templates"""
@@ -229,8 +247,15 @@ class TemplateResponse(NodeResponse):
     model_config = ConfigDict(from_attributes=True)
 
 
-# Union type for polymorphic responses
-NodeResponseUnion = Union[TaskResponse, NoteResponse, FolderResponse, SmartFolderResponse, TemplateResponse]
+# Union type for polymorphic responses, tagged on node_type so validation and
+# serialization dispatch straight to the matching model
+NodeResponseUnion = Annotated[
+    Union[TaskResponse, NoteResponse, FolderResponse, SmartFolderResponse, TemplateResponse],
+    Field(discriminator="node_type"),
+]
+
+# Built once at import; reuse instead of constructing adapters per request
+NODE_RESPONSE_ADAPTER = TypeAdapter(NodeResponseUnion)
 
 
 # Tree/hierarchy schemas
@@ -273,7 +298,7 @@ class NodeBulkUpdate(BaseModel):
     """Schema for bulk node updates"""
     updates: List[tuple[UUID, Union[TaskUpdate, NoteUpdate, FolderUpdate, SmartFolderUpdate, TemplateUpdate]]]
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class NodeMove(BaseModel):
@@ -282,7 +307,7 @@ class NodeMove(BaseModel):
     new_parent_id: Optional[UUID]
     new_sort_order: Optional[int] = None
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class NodeReorder(BaseModel):
@@ -290,7 +315,7 @@ class NodeReorder(BaseModel):
     node_ids: List[UUID] = Field(..., min_length=1)
     parent_id: Optional[UUID] = None
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 # Search and filtering
@@ -307,42 +332,38 @@ class NodeFilter(BaseModel):
     limit: int = Field(default=100, le=1000)
     offset: int = Field(default=0, ge=0)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
+
+
+# Rarely used schemas build their validators lazily (defer_build=True);
+# warm_deferred_schemas() compiles them ahead of the first request.
+DEFERRED_SCHEMAS = (FolderCreate, TemplateCreate, NodeBulkUpdate, NodeMove, NodeReorder, NodeFilter)
+
+
+def warm_deferred_schemas() -> None:
+    """Build the deferred schemas now; blocking, meant for a worker thread at startup."""
+    for model in DEFERRED_SCHEMAS:
+        model.model_rebuild(force=True)
 
 
 # Factory functions for creating polymorphic responses
 def create_node_response(node_data: dict, task_data: dict = None, note_data: dict = None, smart_folder_data: dict = None, template_data: dict = None, folder_data: dict = None) -> NodeResponseUnion:
     """Factory function to create appropriate node response based on type"""
     node_type = node_data.get("node_type")
-
-    if node_type == "task":
-        return TaskResponse(
-            **node_data,
-            task_data=TaskData(**(task_data or {}))
-        )
-    elif node_type == "note":
-        return NoteResponse(
-            **node_data,
-            note_data=NoteData(**(note_data or {}))
-        )
-    elif node_type == "folder":
-        return FolderResponse(
-            **node_data,
-            folder_data=FolderData(**(folder_data or {})) if folder_data else None
-        )
-    elif node_type == "smart_folder":
-        return SmartFolderResponse(
-            **node_data,
-            smart_folder_data=SmartFolderData(**(smart_folder_data or {}))
-        )
-    elif node_type == "template":
-        return TemplateResponse(
-            **node_data,
-            template_data=TemplateData(**(template_data or {}))
-        )
-    else:
+    type_data = {
+        "task": task_data,
+        "note": note_data,
+        "folder": folder_data,
+        "smart_folder": smart_folder_data,
+        "template": template_data,
+    }
+    if node_type not in type_data:
         raise ValueError(f"Unknown node type: {node_type}")
 
+    # Folder data is optional; every other type gets its (possibly defaulted) data block
+    data = type_data[node_type] or (None if node_type == "folder" else {})
+    return NODE_RESPONSE_ADAPTER.validate_python({**node_data, f"{node_type}_data": data})
+
 
 # Template configuration schemas
 class SetTemplateTargetNodeRequest(BaseModel):
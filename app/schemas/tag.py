@@ -1,7 +1,14 @@
 import uuid
 from datetime import datetime
 from pydantic import BaseModel, field_validator
-import re
+
+
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+
+def _is_hex_color(v: str) -> bool:
+    """True for a '#RRGGBB' color code"""
+    return len(v) == 7 and v[0] == "#" and _HEX_DIGITS.issuperset(v[1:])
 
 
 class TagCreate(BaseModel):
@@ -13,7 +20,7 @@ class TagCreate(BaseModel):
     @classmethod
     def validate_color(cls, v):
         if v is not None and v != "":
-            if not re.match(r'^#[0-9a-fA-F]{6}$', v):
+            if not _is_hex_color(v):
                 raise ValueError('Color must be a valid hex code (e.g., #FF0000)')
         return v
 
@@ -27,7 +34,7 @@ class TagUpdate(BaseModel):
     @classmethod
     def validate_color(cls, v):
         if v is not None and v != "":
-            if not re.match(r'^#[0-9a-fA-F]{6}$', v):
+            if not _is_hex_color(v):
                 raise ValueError('Color must be a valid hex code (e.g., #FF0000)')
         return v
 
@@ -1,87 +1,331 @@
 """Smart folder rules engine for dynamic node filtering"""
-from typing import Dict, List, Any, Optional
+import json
+from dataclasses import dataclass
+from functools import lru_cache
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Any, Optional, Set, Tuple
 from uuid import UUID
-from sqlalchemy import select, and_, or_, func
+from pydantic import ValidationError
+from sqlalchemy import select, and_, or_, func, false, true, any_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import BooleanClauseList
 from sqlalchemy.orm import joinedload
 
+from app.models import NODE_SUBTYPES_LOADER
 from app.models.node import Node, Task, Note, SmartFolder
+from app.models.rule import Rule
 from app.models.tag import Tag
 from app.models.node_associations import node_tags
-from app.models.enums import TaskStatus, TaskPriority
+from app.models.enums import NodeType, TaskStatus, TaskPriority
+from app.cache.lru import LRUCache, TTLCache
+from app.schemas.node import SmartFolderCondition, SmartFolderRules
+
+
+# Returned by condition builders for "matches no node" (e.g. a missing saved filter)
+MATCH_NOTHING = false()
+
+# Longest chain of saved_filter references that is compiled
+MAX_SAVED_FILTER_DEPTH = 8
+
+# Matching node ids per (rules, owner, limit) for previews; dashboards re-preview the
+# same rules repeatedly, and a few seconds of staleness is fine for a preview.
+PREVIEW_CACHE_TTL_SECONDS = 10
+_preview_cache = TTLCache(maxsize=1024, ttl=PREVIEW_CACHE_TTL_SECONDS)
+
+
+CONDITION_TYPES = frozenset({
+    "tag_contains", "node_type", "parent_node", "parent_ancestor",
+    "task_status", "task_priority", "title_contains", "has_children",
+    "due_date", "earliest_start", "saved_filter",
+})
+# Operators that take no values (e.g. is_today, is_null, is_not_null)
+NO_VALUES_OPERATORS = frozenset({
+    "is_today", "is_null", "is_not_null", "is_overdue", "this_week",
+    "next_week", "this_month", "yesterday", "tomorrow",
+})
+RULE_LOGICS = frozenset({"AND", "OR"})
+
+# Compiled clauses of DB-independent conditions per (owner, day, condition JSON).
+# Clause elements are immutable and not tied to a session, so they can be shared;
+# the day is part of the key because date conditions bind that day's boundaries.
+_CACHEABLE_CONDITION_TYPES = CONDITION_TYPES - {"tag_contains", "saved_filter"}
+_condition_cache = LRUCache(maxsize=1024)
+
+
+def _uuid_array(ids):
+    """Bind a UUID collection as one array parameter, for `column = ANY(...)`.
+    
+    Unlike an expanded IN (?, ?, ...), the statement text does not depend on
+    how many ids there are, so one prepared statement/plan serves every size.
+    """
+    return bindparam(None, list(ids), type_=ARRAY(PG_UUID(as_uuid=True)), unique=True)
+
+
+def _rule_visible(rule, owner_id: UUID) -> bool:
+    """Rules an owner may use: their own, public and system rules.
+    
+    Checked in Python after a primary-key lookup, so the rule query is a
+    plain index probe rather than an id match ORed across three columns.
+    """
+    return rule.owner_id == owner_id or rule.is_public or rule.is_system
+
+
+@lru_cache(maxsize=1024)
+def _parse_rule_datetime(value: str) -> datetime:
+    """Parse an ISO date/datetime rule value as naive UTC.
+    
+    Memoized: previews resubmit the same rule values on every edit.
+    """
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _escape_like(term: str) -> str:
+    """Escape LIKE wildcards (with backslash as the escape character)"""
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _unique_conditions(conditions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Drop repeated conditions (same content, any key order) before compiling.
+    
+    Repeats never change the result under AND or OR logic.
+    """
+    seen: Set[str] = set()
+    unique = []
+    for condition in conditions:
+        key = json.dumps(condition, sort_keys=True, default=str)
+        if key not in seen:
+            seen.add(key)
+            unique.append(condition)
+    return unique
+
+
+@dataclass(frozen=True)
+class DateContext:
+    """UTC day/week/month boundaries for one evaluation, so every date condition
+    in a rule set is measured against the same "now".
+
+    Periods are half-open: a period is [its start, the next period's start).
+    """
+    today: date
+    today_start: datetime
+    tomorrow_start: datetime
+    week_start: datetime
+    next_week_start: datetime
+    week_after_next_start: datetime
+    month_start: datetime
+    next_month_start: datetime
+
+    def day_start(self, days_from_today: int) -> datetime:
+        return self.today_start + timedelta(days=days_from_today)
+
+
+def compute_date_context(now: Optional[datetime] = None) -> DateContext:
+    today = (now or datetime.now(timezone.utc)).date()
+
+    def start(d: date) -> datetime:
+        return datetime(d.year, d.month, d.day, tzinfo=timezone.utc)
+
+    week_start = today - timedelta(days=today.weekday())  # Monday
+    month_start = today.replace(day=1)
+    next_month_start = (month_start + timedelta(days=32)).replace(day=1)
+    return DateContext(
+        today=today,
+        today_start=start(today),
+        tomorrow_start=start(today + timedelta(days=1)),
+        week_start=start(week_start),
+        next_week_start=start(week_start + timedelta(days=7)),
+        week_after_next_start=start(week_start + timedelta(days=14)),
+        month_start=start(month_start),
+        next_month_start=start(next_month_start),
+    )
+
+
+# Day-count date operators: (date context, task column, N days) -> predicates.
+# Aliases share one entry; the starts_ forms read better for earliest_start_at.
+def _on_day(ctx: DateContext, column, offset: int):
+    return (column >= ctx.day_start(offset), column < ctx.day_start(offset + 1))
+
+
+def _from_today_through(ctx: DateContext, column, days: int):
+    return (column.is_not(None), column >= ctx.today_start, column < ctx.day_start(days + 1))
+
+
+def _after_day(ctx: DateContext, column, days: int):
+    return (column.is_not(None), column >= ctx.day_start(days + 1))
+
+
+_DAY_COUNT_OPERATORS = {
+    # Overdue by exactly / more than / less than N days
+    "overdue_by_days": lambda ctx, column, days: _on_day(ctx, column, -days),
+    "overdue_by_more_than": lambda ctx, column, days: (
+        column.is_not(None), column < ctx.day_start(1 - days),
+    ),
+    "overdue_by_less_than": lambda ctx, column, days: (
+        column.is_not(None), column < ctx.today_start, column >= ctx.day_start(-days),
+    ),
+    # Upcoming: in exactly N days, within the next N days (includes today), later
+    "due_in_days": _on_day,
+    "due_within_days": _from_today_through,
+    "within_next_days": _from_today_through,
+    "starts_within_days": _from_today_through,
+    "due_in_more_than_days": _after_day,
+    "starts_in_more_than_days": _after_day,
+    # Past: within the last N days (includes today), before that, exactly N days ago
+    "within_last_days": lambda ctx, column, days: (
+        column.is_not(None), column >= ctx.day_start(-days), column < ctx.tomorrow_start,
+    ),
+    "more_than_days_ago": lambda ctx, column, days: (
+        column.is_not(None), column < ctx.day_start(-days),
+    ),
+    "exactly_days_ago": lambda ctx, column, days: _on_day(ctx, column, -days),
+}
+_DUE_AT_ONLY_OPERATORS = frozenset({"overdue_by_days", "overdue_by_more_than", "overdue_by_less_than"})
 
 
 class SmartFolderRulesEngine:
-    """Engine for evaluating smart folder rules and generating filtered node queries"""
+    """Engine for evaluating smart folder rules and generating filtered node queries
+
+    Supporting indexes: ix_node_owner_type_parent / ix_node_owner_parent for the
+    owner-scoped base query and type/parent conditions, ix_node_tags_tag_node for
+    tag conditions, ix_node_path_gist for ancestor conditions.
+    """
     
     def __init__(self, session: AsyncSession):
         self.session = session
+        # Compiled saved_filter clauses per (rule_id, owner_id), for this engine's lifetime
+        self._filter_cache: Dict[Tuple[str, UUID], Any] = {}
+        # Rules referenced by saved_filter conditions, batch-loaded by _preload_rules
+        # (None marks an id that was looked up but is missing or not visible)
+        self._rule_cache: Dict[UUID, Any] = {}
+        # saved_filter rules currently being compiled, outermost first
+        self._saved_filter_stack: List[UUID] = []
+        # Date boundaries shared by all date conditions of one evaluation
+        self._date_ctx: Optional[DateContext] = None
+    
+    async def evaluate_smart_folder(
+        self,
+        smart_folder: SmartFolder,
+        owner_id: UUID,
+        limit: Optional[int] = None,
+    ) -> List[Node]:
+        """Evaluate a smart folder's rules and return matching nodes (at most limit)"""
+        criteria = await self._build_folder_criteria(smart_folder, owner_id)
+        if criteria is None:
+            return []
+        
+        # Subtype columns are batch-loaded so callers can serialize without
+        # per-node queries.
+        query = self._select_matching(criteria, Node).options(NODE_SUBTYPES_LOADER).limit(limit)
+        result = await self.session.execute(query)
+        return result.scalars().all()
+    
+    @staticmethod
+    def _select_matching(criteria: List[Any], *entities):
+        """SELECT entities FROM nodes matching the criteria.
+        
+        node_tasks is joined once for the task predicates (see _task_condition);
+        PostgreSQL drops the join when none are used.
+        """
+        return select(*entities).outerjoin(Task.__table__, Task.id == Node.id).where(*criteria)
     
-    async def evaluate_smart_folder(self, smart_folder: SmartFolder, owner_id: UUID) -> List[Node]:
-        """Evaluate a smart folder's rules and return matching nodes"""
+    async def _build_folder_criteria(self, smart_folder: SmartFolder, owner_id: UUID) -> Optional[List[Any]]:
+        """WHERE criteria selecting a smart folder's nodes, or None when nothing can match"""
         # Check if using new rule_id approach
         if smart_folder.rule_id:
-            # Fetch the rule
-            from app.models.rule import Rule
-            rule_query = select(Rule).where(
-                Rule.id == smart_folder.rule_id,
-                or_(
-                    Rule.owner_id == owner_id,
-                    Rule.is_public == True,
-                    Rule.is_system == True
-                )
-            )
-            result = await self.session.execute(rule_query)
-            rule = result.scalar_one_or_none()
+            # Fetch the rule, together with the rules it references
+            await self._preload_rules({smart_folder.rule_id}, owner_id)
+            rule = self._rule_cache[smart_folder.rule_id]
             
             if not rule or not rule.rule_data:
-                return []
+                return None
             
             rules = rule.rule_data
         else:
             # Fall back to legacy inline rules
             rules = smart_folder.rules
             if not rules or not rules.get("conditions"):
-                return []
+                return None
+        
+        return await self._build_criteria(rules, owner_id, exclude_id=smart_folder.id)
+    
+    async def _build_criteria(
+        self, rules: Dict[str, Any], owner_id: UUID, exclude_id: Optional[UUID] = None
+    ) -> Optional[List[Any]]:
+        """WHERE criteria for a rule set, or None when nothing can match.
+        
+        exclude_id is the evaluated smart folder itself (previews have none).
+        """
+        await self._preload_rules(self._saved_filter_ids(rules), owner_id)
+        self._date_ctx = compute_date_context()
         
-        # Build the base query
-        query = select(Node).where(
+        criteria = [
             Node.owner_id == owner_id,
-            Node.id != smart_folder.id,  # Exclude the smart folder itself
             Node.node_type != "template"  # Exclude templates from search results
-        )
+        ]
+        if exclude_id is not None:
+            criteria.append(Node.id != exclude_id)
         
-        # Apply conditions
-        conditions = []
-        for condition in rules.get("conditions", []):
-            condition_filter = await self._build_condition_filter(condition, owner_id)
-            if condition_filter is not None:
-                conditions.append(condition_filter)
-        
-        if conditions:
-            # Apply logic (AND/OR)
-            logic = rules.get("logic", "AND")
-            if logic == "AND":
-                query = query.where(and_(*conditions))
-            else:  # OR
-                query = query.where(or_(*conditions))
-        
-        # Execute query
-        result = await self.session.execute(query)
-        return result.scalars().all()
+        clause = await self._build_rules_clause(rules, owner_id)
+        if clause is MATCH_NOTHING:
+            return None
+        criteria.append(clause)
+        return criteria
+    
+    async def _build_rules_clause(self, rules: Dict[str, Any], owner_id: UUID):
+        """Combine a rule set's conditions with its logic (AND/OR).
+        
+        Conditions that cannot be compiled (unknown type or operator, bad
+        values) or can never match decide an AND outright and drop out of an
+        OR. A rule set left with nothing to filter on matches nothing rather
+        than every node of the owner; MATCH_NOTHING lets callers skip the query.
+        """
+        conditions = [
+            await self._build_condition_filter(condition, owner_id)
+            for condition in _unique_conditions(rules.get("conditions", []))
+        ]
+        if rules.get("logic", "AND") == "AND":
+            if not conditions or any(c is None or c is MATCH_NOTHING for c in conditions):
+                return MATCH_NOTHING
+            return and_(*self._merge_conjuncts(conditions))
+        # OR
+        conditions = [c for c in conditions if c is not None and c is not MATCH_NOTHING]
+        if not conditions:
+            return MATCH_NOTHING
+        return or_(*conditions)
     
     async def _build_condition_filter(self, condition: Dict[str, Any], owner_id: UUID):
-        """Build SQLAlchemy filter from a condition dictionary"""
+        """Build SQLAlchemy filter from a condition dictionary
+        
+        Conditions that compile without the database are memoized in
+        _condition_cache; the rest (tags, saved filters) are built every time.
+        """
+        if condition.get("type") not in _CACHEABLE_CONDITION_TYPES:
+            return await self._compile_condition_filter(condition, owner_id)
+        
+        ctx = self._date_ctx or compute_date_context()
+        cache_key = (owner_id, ctx.today, json.dumps(condition, sort_keys=True, default=str))
+        clause = _condition_cache.get(cache_key)
+        if clause is None:
+            clause = await self._compile_condition_filter(condition, owner_id)
+            if clause is not None:
+                _condition_cache.set(cache_key, clause)
+        return clause
+    
+    async def _compile_condition_filter(self, condition: Dict[str, Any], owner_id: UUID):
         condition_type = condition.get("type")
         operator = condition.get("operator")
-        values = condition.get("values", [])
+        # Raw rule dicts (preview, PUT rules) may carry JSON numbers
+        values = SmartFolderCondition.numbers_to_str(condition.get("values", []))
         
         if not condition_type or not operator:
             return None
         
-        # Some operators don't require values (e.g., is_today, is_null, is_not_null)
-        no_values_operators = ["is_today", "is_null", "is_not_null", "is_overdue", "this_week", "next_week", "this_month", "yesterday", "tomorrow"]
-        if operator not in no_values_operators and not values:
+        if operator not in NO_VALUES_OPERATORS and not values:
             return None
         
         if condition_type == "node_type":
@@ -94,7 +338,7 @@ class SmartFolderRulesEngine:
             return self._build_parent_filter(operator, values)
         
         elif condition_type == "parent_ancestor":
-            return await self._build_ancestor_filter(operator, values)
+            return self._build_ancestor_filter(operator, values, owner_id)
         
         elif condition_type == "task_status":
             return self._build_task_status_filter(operator, values)
@@ -109,10 +353,10 @@ class SmartFolderRulesEngine:
             return await self._build_children_filter(operator, values)
             
         elif condition_type == "due_date":
-            return self._build_date_filter(operator, values, "due_at")
+            return self._owner_scoped(self._build_date_filter(operator, values, "due_at"), owner_id)
             
         elif condition_type == "earliest_start":
-            return self._build_date_filter(operator, values, "earliest_start_at")
+            return self._owner_scoped(self._build_date_filter(operator, values, "earliest_start_at"), owner_id)
         
         elif condition_type == "saved_filter":
             return await self._build_saved_filter(operator, values, owner_id)
@@ -121,48 +365,50 @@ class SmartFolderRulesEngine:
     
     def _build_node_type_filter(self, operator: str, values: List[str]):
         """Build filter for node type conditions"""
+        # node_type is stored as a SMALLINT code, so names outside NodeType
+        # cannot be bound; they simply match no node
+        known = [v for v in values if v in NodeType.__members__]
         if operator == "equals":
-            return Node.node_type == values[0]
+            return Node.node_type == values[0] if values[0] in known else MATCH_NOTHING
         elif operator == "in":
-            return Node.node_type.in_(values)
+            return Node.node_type.in_(known) if known else MATCH_NOTHING
         elif operator == "not_equals":
-            return Node.node_type != values[0]
+            return Node.node_type != values[0] if values[0] in known else true()
         return None
     
     async def _build_tag_filter(self, operator: str, values: List[str], owner_id: UUID):
         """Build filter for tag-related conditions"""
-        # Convert string UUIDs to UUID objects
         try:
-            tag_uuids = [UUID(v) for v in values]
+            # Order-preserving dedupe; "all" counts distinct tags
+            tag_uuids = list(dict.fromkeys(UUID(v) for v in values))
         except (ValueError, TypeError):
             return None
         
+        # With a single tag, "all" and "any" match the same nodes; skip the aggregate
+        if operator == "all" and len(tag_uuids) == 1:
+            operator = "any"
+        
         if operator == "any":
             # Node has any of the specified tags
             return Node.id.in_(
                 select(node_tags.c.node_id).where(
-                    node_tags.c.tag_id.in_(tag_uuids)
+                    node_tags.c.owner_id == owner_id,
+                    node_tags.c.tag_id == any_(_uuid_array(tag_uuids))
                 )
             )
         elif operator == "all":
-            # Node has all of the specified tags
-            # This is complex - need to check each tag individually
-            subqueries = []
-            for tag_uuid in tag_uuids:
-                subqueries.append(
-                    select(node_tags.c.node_id).where(
-                        node_tags.c.tag_id == tag_uuid
-                    )
+            # Node has all of the specified tags: one pass over node_tags, keeping
+            # nodes that matched every tag. (owner_id, node_id, tag_id) is the
+            # primary key, so a plain count equals the number of distinct tags.
+            return Node.id.in_(
+                select(node_tags.c.node_id)
+                .where(
+                    node_tags.c.owner_id == owner_id,
+                    node_tags.c.tag_id == any_(_uuid_array(tag_uuids))
                 )
-            
-            if len(subqueries) == 1:
-                return Node.id.in_(subqueries[0])
-            else:
-                # Node must appear in all subqueries
-                base_query = subqueries[0]
-                for subquery in subqueries[1:]:
-                    base_query = base_query.intersect(subquery)
-                return Node.id.in_(base_query)
+                .group_by(node_tags.c.node_id)
+                .having(func.count() == len(tag_uuids))
+            )
         
         return None
     
@@ -173,88 +419,102 @@ class SmartFolderRulesEngine:
                 return Node.parent_id == UUID(values[0])
             elif operator == "in":
                 parent_uuids = [UUID(v) for v in values]
-                return Node.parent_id.in_(parent_uuids)
+                return Node.parent_id == any_(_uuid_array(parent_uuids))
         except (ValueError, TypeError):
             pass
         return None
     
-    async def _build_ancestor_filter(self, operator: str, values: List[str]):
+    def _build_ancestor_filter(self, operator: str, values: List[str], owner_id: UUID):
         """Build filter for ancestor node conditions (hierarchical parent search)"""
         try:
             if operator == "equals":
-                ancestor_id = UUID(values[0])
-                # Use recursive CTE to find all descendants of the ancestor
-                return await self._build_descendants_subquery(ancestor_id)
+                return self._build_descendants_subquery(UUID(values[0]), owner_id)
             elif operator == "in":
-                ancestor_uuids = [UUID(v) for v in values]
-                # Combine multiple ancestor searches with OR
-                conditions = []
-                for ancestor_id in ancestor_uuids:
-                    condition = await self._build_descendants_subquery(ancestor_id)
-                    if condition is not None:
-                        conditions.append(condition)
-                return or_(*conditions) if conditions else None
+                ancestor_uuids = list(dict.fromkeys(UUID(v) for v in values))
+                # One subtree match per ancestor, ORed inside the same query (a
+                # BitmapOr of GiST scans); the shared predicates are applied once.
+                return and_(
+                    or_(*(self._descendant_path_match(a, owner_id) for a in ancestor_uuids)),
+                    *self._subtree_scope(owner_id),
+                )
         except (ValueError, TypeError):
             pass
         return None
     
-    async def _build_descendants_subquery(self, ancestor_id: UUID):
-        """Build a subquery to find all descendants of an ancestor node using recursive CTE"""
-        from sqlalchemy import text
-        
-        # PostgreSQL recursive CTE to find all descendants
-        descendants_cte = text("""
-            WITH RECURSIVE node_hierarchy AS (
-                -- Base case: direct children of the ancestor
-                SELECT id, parent_id, title
-                FROM nodes 
-                WHERE parent_id = :ancestor_id
-                
-                UNION ALL
-                
-                -- Recursive case: children of already found nodes
-                SELECT n.id, n.parent_id, n.title
-                FROM nodes n
-                INNER JOIN node_hierarchy nh ON n.parent_id = nh.id
-            )
-            SELECT id FROM node_hierarchy
-        """)
-        
-        # Execute the CTE to get descendant IDs
-        result = await self.session.execute(descendants_cte, {"ancestor_id": ancestor_id})
-        descendant_ids = [row[0] for row in result.fetchall()]
-        
-        if descendant_ids:
-            return Node.id.in_(descendant_ids)
-        return None
+    def _build_descendants_subquery(self, ancestor_id: UUID, owner_id: UUID):
+        """Build a filter matching all descendants of an ancestor node.
+
+        Uses the materialized ltree path, so the whole subtree is a single GiST
+        index scan inside the main query instead of a separate recursive CTE
+        round trip. The owner and template predicates are repeated here so the
+        subtree scan is pruned on its own, whatever query it is embedded in.
+        """
+        return and_(
+            self._descendant_path_match(ancestor_id, owner_id),
+            *self._subtree_scope(owner_id),
+        )
+    
+    @staticmethod
+    def _descendant_path_match(ancestor_id: UUID, owner_id: UUID):
+        """Nodes strictly beneath ancestor_id, by ltree path"""
+        ancestor_path = (
+            select(Node.path)
+            .where(Node.id == ancestor_id, Node.owner_id == owner_id)
+            .scalar_subquery()
+        )
+        return and_(Node.path.descendant_of(ancestor_path), Node.id != ancestor_id)
+    
+    @staticmethod
+    def _subtree_scope(owner_id: UUID):
+        return (Node.owner_id == owner_id, Node.node_type != "template")
+    
+    @staticmethod
+    def _merge_conjuncts(conditions: List[Any]) -> List[Any]:
+        """Flatten ANDed conditions into one predicate list without repeats.
+        
+        Several date conditions on the same task column each carry the task
+        type check (and often IS NOT NULL); under AND they fold into a single
+        task predicate plus the column's range bounds.
+        """
+        merged: List[Any] = []
+        stack = list(reversed(conditions))
+        while stack:
+            clause = stack.pop()
+            if isinstance(clause, BooleanClauseList) and clause.operator is operators.and_:
+                stack.extend(reversed(clause.clauses))
+            elif not any(clause.compare(seen) for seen in merged):
+                merged.append(clause)
+        return merged
+    
+    @staticmethod
+    def _owner_scoped(task_clause, owner_id: UUID):
+        """Add node_tasks.owner_id to a task clause, so date ranges are served
+        by the (owner_id, due_at) / (owner_id, earliest_start_at) indexes."""
+        if task_clause is None:
+            return None
+        return and_(Task.owner_id == owner_id, task_clause)
+    
+    @staticmethod
+    def _task_condition(*predicates):
+        """Predicates on node_tasks columns, limited to task nodes.
+        
+        node_tasks is LEFT JOINed once in evaluate_smart_folder, so these are
+        plain column comparisons rather than IN (SELECT id FROM node_tasks ...).
+        """
+        return and_(Node.node_type == "task", *predicates)
     
     def _build_task_status_filter(self, operator: str, values: List[str]):
         """Build filter for task status conditions (only applies to task nodes)"""
         try:
             if operator == "equals":
                 status = TaskStatus(values[0])
-                return and_(
-                    Node.node_type == "task",
-                    Node.id.in_(
-                        select(Task.id).where(Task.status == status)
-                    )
-                )
+                return self._task_condition(Task.status == status)
             elif operator == "in":
                 statuses = [TaskStatus(v) for v in values]
-                return and_(
-                    Node.node_type == "task",
-                    Node.id.in_(
-                        select(Task.id).where(Task.status.in_(statuses))
-                    )
-                )
+                return self._task_condition(Task.status.in_(statuses))
             elif operator == "not_in":
                 statuses = [TaskStatus(v) for v in values]
-                return and_(
-                    Node.node_type == "task",
-                    Node.id.in_(
-                        select(Task.id).where(~Task.status.in_(statuses))
-                    )
-                )
+                return self._task_condition(~Task.status.in_(statuses))
         except (ValueError, TypeError):
             pass
         return None
@@ -264,20 +524,10 @@ class SmartFolderRulesEngine:
         try:
             if operator == "equals":
                 priority = TaskPriority(values[0])
-                return and_(
-                    Node.node_type == "task",
-                    Node.id.in_(
-                        select(Task.id).where(Task.priority == priority)
-                    )
-                )
+                return self._task_condition(Task.priority == priority)
             elif operator == "in":
                 priorities = [TaskPriority(v) for v in values]
-                return and_(
-                    Node.node_type == "task",
-                    Node.id.in_(
-                        select(Task.id).where(Task.priority.in_(priorities))
-                    )
-                )
+                return self._task_condition(Task.priority.in_(priorities))
         except (ValueError, TypeError):
             pass
         return None
@@ -285,7 +535,10 @@ class SmartFolderRulesEngine:
     def _build_title_filter(self, operator: str, values: List[str]):
         """Build filter for title search conditions"""
         if operator == "contains":
-            return Node.title.ilike(f"%{values[0]}%")
+            # Same match as ILIKE, in the form served by ix_node_title_trgm.
+            # The term is matched literally: % and _ in it are not wildcards.
+            term = _escape_like(str(values[0]).lower())
+            return func.lower(Node.title).like(f"%{term}%", escape="\\")
         elif operator == "equals":
             return Node.title == values[0]
         return None
@@ -294,134 +547,133 @@ class SmartFolderRulesEngine:
         """Build filter for nodes with/without children"""
         if operator == "equals":
             has_children = values[0].lower() in ("true", "1", "yes")
+            # child_count is kept by the nodes_child_count trigger, so this is a
+            # per-row comparison rather than a subquery over all parent ids
             if has_children:
-                # Nodes that have children
-                return Node.id.in_(
-                    select(Node.parent_id).where(Node.parent_id.is_not(None)).distinct()
-                )
+                return Node.child_count > 0
             else:
-                # Nodes that don't have children
-                return Node.id.not_in(
-                    select(Node.parent_id).where(Node.parent_id.is_not(None)).distinct()
-                )
+                return Node.child_count == 0
         return None
     
+    @staticmethod
+    def _saved_filter_ids(rules: Dict[str, Any]) -> Set[UUID]:
+        """Rule ids referenced by saved_filter conditions (invalid ids are skipped)"""
+        ids = set()
+        for condition in rules.get("conditions", []):
+            values = condition.get("values") or []
+            if condition.get("type") == "saved_filter" and values and values[0]:
+                try:
+                    ids.add(UUID(str(values[0])))
+                except ValueError:
+                    pass
+        return ids
+    
+    async def _preload_rules(self, rule_ids: Set[UUID], owner_id: UUID) -> None:
+        """Load the given rules and every rule reachable from them through
+        saved_filter conditions into _rule_cache.
+        
+        One query per nesting level instead of one per rule.
+        """
+        pending = set(rule_ids) - self._rule_cache.keys()
+        while pending:
+            result = await self.session.execute(
+                select(Rule).where(Rule.id == any_(_uuid_array(pending)))
+            )
+            self._rule_cache.update(dict.fromkeys(pending))
+            nested = set()
+            for rule in result.scalars():
+                if not _rule_visible(rule, owner_id):
+                    continue
+                self._rule_cache[rule.id] = rule
+                if rule.rule_data:
+                    nested |= self._saved_filter_ids(rule.rule_data)
+            pending = nested - self._rule_cache.keys()
+    
     async def _build_saved_filter(self, operator: str, values: List[str], owner_id: UUID):
         """Build filter for saved filter (rule reference) conditions"""
         if not values or not values[0]:
             # No rule ID provided - filter out everything
-            return False
+            return MATCH_NOTHING
             
         rule_id = values[0]
-        
-        # Import here to avoid circular imports
-        from app.models.rule import Rule
+        cache_key = (rule_id, owner_id)
+        if cache_key in self._filter_cache:
+            return self._filter_cache[cache_key]
         
         try:
             # Validate the rule_id is a valid UUID
-            from uuid import UUID as validate_uuid
-            validate_uuid(rule_id)
-        except (ValueError, AttributeError):
+            rule_uuid = UUID(rule_id)
+        except (ValueError, AttributeError, TypeError):
             # Invalid UUID - filter out everything
-            return False
-        
-        # Get the referenced rule
-        rule_query = select(Rule).where(
-            Rule.id == rule_id,
-            or_(
-                Rule.owner_id == owner_id,
-                Rule.is_public == True,
-                Rule.is_system == True
-            )
-        )
+            return MATCH_NOTHING
         
-        result = await self.session.execute(rule_query)
-        rule = result.scalar_one_or_none()
+        if rule_uuid in self._saved_filter_stack or len(self._saved_filter_stack) >= MAX_SAVED_FILTER_DEPTH:
+            # A rule referencing itself (directly or through other rules), or a
+            # chain too deep to be intentional: the reference cannot be compiled
+            return None
+        
+        # Get the referenced rule (normally already batch-loaded by _preload_rules)
+        if rule_uuid not in self._rule_cache:
+            await self._preload_rules({rule_uuid}, owner_id)
+        rule = self._rule_cache[rule_uuid]
         
         if not rule or not rule.rule_data:
             # Rule not found or has no data - filter out everything
             # This prevents showing all nodes when a rule is missing
-            return False
+            self._filter_cache[cache_key] = MATCH_NOTHING
+            return MATCH_NOTHING
         
         # Recursively evaluate the referenced rule's conditions
-        conditions = []
-        for condition in rule.rule_data.get("conditions", []):
-            condition_filter = await self._build_condition_filter(condition, owner_id)
-            if condition_filter is not None:
-                conditions.append(condition_filter)
-        
-        if not conditions:
-            return None
-            
-        # Apply the referenced rule's logic
-        logic = rule.rule_data.get("logic", "AND")
-        if logic == "AND":
-            return and_(*conditions)
-        else:  # OR
-            return or_(*conditions)
+        self._saved_filter_stack.append(rule_uuid)
+        try:
+            clause = await self._build_rules_clause(rule.rule_data, owner_id)
+        finally:
+            self._saved_filter_stack.pop()
+        self._filter_cache[cache_key] = clause
+        return clause
     
     async def preview_smart_folder_results(self, rules: Dict[str, Any], owner_id: UUID, limit: int = 10) -> List[Node]:
         """Preview results for smart folder rules without creating the folder"""
-        # Create a temporary smart folder object for evaluation
-        temp_folder = SmartFolder(
-            id=UUID("00000000-0000-0000-0000-000000000000"),  # Dummy ID
-            owner_id=owner_id,
-            title="Preview",
-            rules=rules,
-            node_type="smart_folder"
+        cache_key = (json.dumps(rules, sort_keys=True, default=str), owner_id, limit)
+        node_ids = _preview_cache.get(cache_key)
+        if node_ids is None:
+            node_ids = await self._preview_node_ids(rules, owner_id, limit)
+            _preview_cache.set(cache_key, node_ids)
+        if not node_ids:
+            return []
+        
+        # Only the previewed nodes are loaded as ORM instances
+        result = await self.session.execute(
+            select(Node).options(NODE_SUBTYPES_LOADER).where(Node.id == any_(_uuid_array(node_ids)))
         )
-        
-        results = await self.evaluate_smart_folder(temp_folder, owner_id)
-        return results[:limit]  # Limit results for preview
+        by_id = {node.id: node for node in result.scalars()}
+        return [by_id[node_id] for node_id in node_ids if node_id in by_id]
+    
+    async def _preview_node_ids(self, rules: Dict[str, Any], owner_id: UUID, limit: int) -> List[UUID]:
+        if not rules or not rules.get("conditions"):
+            return []
+        criteria = await self._build_criteria(rules, owner_id)
+        if criteria is None:
+            return []
+        result = await self.session.execute(self._select_matching(criteria, Node.id).limit(limit))
+        return list(result.scalars())
     
     def _build_date_filter(self, operator: str, values: List[str], date_field: str):
         """Build filter for date-based conditions (due_at, earliest_start_at)"""
-        from datetime import datetime, timezone, timedelta
-        
-        # Only apply to task nodes since they have these date fields
-        base_condition = and_(
-            Node.node_type == "task",
-            Node.id.in_(
-                select(Task.id)
-            )
-        )
+        ctx = self._date_ctx or compute_date_context()
+        column = getattr(Task, date_field)
         
         if operator == "is_null":
-            return and_(
-                base_condition,
-                Node.id.in_(
-                    select(Task.id).where(
-                        getattr(Task, date_field).is_(None)
-                    )
-                )
-            )
+            return self._task_condition(column.is_(None))
             
         elif operator == "is_not_null":
-            return and_(
-                base_condition,
-                Node.id.in_(
-                    select(Task.id).where(
-                        getattr(Task, date_field).is_not(None)
-                    )
-                )
-            )
+            return self._task_condition(column.is_not(None))
         
         elif operator == "is_today":
             # Handle "is_today" operator - no values needed
-            today = datetime.now(timezone.utc).date()
-            start_of_day = datetime.combine(today, datetime.min.time()).replace(tzinfo=timezone.utc)
-            end_of_day = datetime.combine(today, datetime.max.time()).replace(tzinfo=timezone.utc)
-            
-            return and_(
-                base_condition,
-                Node.id.in_(
-                    select(Task.id).where(
-                        and_(
-                            getattr(Task, date_field) >= start_of_day,
-                            getattr(Task, date_field) <= end_of_day
-                        )
-                    )
-                )
+            return self._task_condition(
+                column >= ctx.today_start,
+                column < ctx.tomorrow_start,
             )
         
         # Phase 1: Overdue Detection (no values needed)
@@ -429,409 +681,87 @@ class SmartFolderRulesEngine:
             # Due date is in the past (only applies to due_at field)
             if date_field != "due_at":
                 return None
-            today_start = datetime.combine(datetime.now(timezone.utc).date(), datetime.min.time()).replace(tzinfo=timezone.utc)
-            return and_(
-                base_condition,
-                Node.id.in_(
-                    select(Task.id).where(
-                        and_(
-                            Task.due_at.is_not(None),
-                            Task.due_at < today_start
-                        )
-                    )
-                )
+            return self._task_condition(
+                Task.due_at.is_not(None),
+                Task.due_at < ctx.today_start,
             )
         
         # Phase 3: Calendar Periods (no values needed)
         elif operator == "this_week":
             # Current calendar week (Monday to Sunday)
-            today = datetime.now(timezone.utc).date()
-            # Calculate start of week (Monday)
-            days_since_monday = today.weekday()  # Monday = 0, Sunday = 6
-            week_start = today - timedelta(days=days_since_monday)
-            week_end = week_start + timedelta(days=6)
-            
-            start_of_week = datetime.combine(week_start, datetime.min.time()).replace(tzinfo=timezone.utc)
-            end_of_week = datetime.combine(week_end, datetime.max.time()).replace(tzinfo=timezone.utc)
-            
-            return and_(
-                base_condition,
-                Node.id.in_(
-                    select(Task.id).where(
-                        and_(
-                            getattr(Task, date_field).is_not(None),
-                            getattr(Task, date_field) >= start_of_week,
-                            getattr(Task, date_field) <= end_of_week
-                        )
-                    )
-                )
+            return self._task_condition(
+                column.is_not(None),
+                column >= ctx.week_start,
+                column < ctx.next_week_start,
             )
             
         elif operator == "next_week":
             # Next calendar week (Monday to Sunday)
-            today = datetime.now(timezone.utc).date()
-            days_since_monday = today.weekday()
-            this_week_start = today - timedelta(days=days_since_monday)
-            next_week_start = this_week_start + timedelta(days=7)
-            next_week_end = next_week_start + timedelta(days=6)
-            
-            start_of_next_week = datetime.combine(next_week_start, datetime.min.time()).replace(tzinfo=timezone.utc)
-            end_of_next_week = datetime.combine(next_week_end, datetime.max.time()).replace(tzinfo=timezone.utc)
-            
-            return and_(
-                base_condition,
-                Node.id.in_(
-                    select(Task.id).where(
-                        and_(
-                            getattr(Task, date_field).is_not(None),
-                            getattr(Task, date_field) >= start_of_next_week,
-                            getattr(Task, date_field) <= end_of_next_week
-                        )
-                    )
-                )
+            return self._task_condition(
+                column.is_not(None),
+                column >= ctx.next_week_start,
+                column < ctx.week_after_next_start,
             )
             
         elif operator == "this_month":
             # Current calendar month
-            today = datetime.now(timezone.utc).date()
-            month_start = today.replace(day=1)
-            # Get last day of month
-            if today.month == 12:
-                next_month_start = today.replace(year=today.year + 1, month=1, day=1)
-            else:
-                next_month_start = today.replace(month=today.month + 1, day=1)
-            month_end = next_month_start - timedelta(days=1)
-            
-            start_of_month = datetime.combine(month_start, datetime.min.time()).replace(tzinfo=timezone.utc)
-            end_of_month = datetime.combine(month_end, datetime.max.time()).replace(tzinfo=timezone.utc)
-            
-            return and_(
-                base_condition,
-                Node.id.in_(
-                    select(Task.id).where(
-                        and_(
-                            getattr(Task, date_field).is_not(None),
-                            getattr(Task, date_field) >= start_of_month,
-                            getattr(Task, date_field) <= end_of_month
-                        )
-                    )
-                )
+            return self._task_condition(
+                column.is_not(None),
+                column >= ctx.month_start,
+                column < ctx.next_month_start,
             )
             
         elif operator == "yesterday":
             # Date was yesterday
-            yesterday = datetime.now(timezone.utc).date() - timedelta(days=1)
-            start_of_day = datetime.combine(yesterday, datetime.min.time()).replace(tzinfo=timezone.utc)
-            end_of_day = datetime.combine(yesterday, datetime.max.time()).replace(tzinfo=timezone.utc)
-            
-            return and_(
-                base_condition,
-                Node.id.in_(
-                    select(Task.id).where(
-                        and_(
-                            getattr(Task, date_field) >= start_of_day,
-                            getattr(Task, date_field) <= end_of_day
-                        )
-                    )
-                )
+            return self._task_condition(
+                column >= ctx.day_start(-1),
+                column < ctx.today_start,
             )
             
         elif operator == "tomorrow":
             # Date is tomorrow
-            tomorrow = datetime.now(timezone.utc).date() + timedelta(days=1)
-            start_of_day = datetime.combine(tomorrow, datetime.min.time()).replace(tzinfo=timezone.utc)
-            end_of_day = datetime.combine(tomorrow, datetime.max.time()).replace(tzinfo=timezone.utc)
-            
-            return and_(
-                base_condition,
-                Node.id.in_(
-                    select(Task.id).where(
-                        and_(
-                            getattr(Task, date_field) >= start_of_day,
-                            getattr(Task, date_field) <= end_of_day
-                        )
-                    )
-                )
+            return self._task_condition(
+                column >= ctx.tomorrow_start,
+                column < ctx.day_start(2),
             )
         
         # Operators that require values
         if not values or not values[0]:
             return None
             
-        # Phase 1: Overdue Detection (with values)
-        if operator in ["overdue_by_days", "overdue_by_more_than", "overdue_by_less_than"]:
-            if date_field != "due_at":  # Only applies to due dates
-                return None
-            try:
-                days = int(values[0])
-                today = datetime.now(timezone.utc).date()
-                
-                if operator == "overdue_by_days":
-                    # Overdue by exactly N days
-                    target_date = today - timedelta(days=days)
-                    start_of_day = datetime.combine(target_date, datetime.min.time()).replace(tzinfo=timezone.utc)
-                    end_of_day = datetime.combine(target_date, datetime.max.time()).replace(tzinfo=timezone.utc)
-                    return and_(
-                        base_condition,
-                        Node.id.in_(
-                            select(Task.id).where(
-                                and_(
-                                    Task.due_at >= start_of_day,
-                                    Task.due_at <= end_of_day
-                                )
-                            )
-                        )
-                    )
-                elif operator == "overdue_by_more_than":
-                    # Overdue by more than N days
-                    cutoff_date = today - timedelta(days=days)
-                    cutoff_end = datetime.combine(cutoff_date, datetime.max.time()).replace(tzinfo=timezone.utc)
-                    return and_(
-                        base_condition,
-                        Node.id.in_(
-                            select(Task.id).where(
-                                and_(
-                                    Task.due_at.is_not(None),
-                                    Task.due_at < cutoff_end
-                                )
-                            )
-                        )
-                    )
-                elif operator == "overdue_by_less_than":
-                    # Overdue by less than N days
-                    cutoff_date = today - timedelta(days=days)
-                    today_start = datetime.combine(today, datetime.min.time()).replace(tzinfo=timezone.utc)
-                    cutoff_start = datetime.combine(cutoff_date, datetime.min.time()).replace(tzinfo=timezone.utc)
-                    return and_(
-                        base_condition,
-                        Node.id.in_(
-                            select(Task.id).where(
-                                and_(
-                                    Task.due_at.is_not(None),
-                                    Task.due_at < today_start,
-                                    Task.due_at >= cutoff_start
-                                )
-                            )
-                        )
-                    )
-            except (ValueError, TypeError):
+        # Day-count operators (overdue_by_days, due_within_days, ...)
+        day_count_predicates = _DAY_COUNT_OPERATORS.get(operator)
+        if day_count_predicates is not None:
+            if operator in _DUE_AT_ONLY_OPERATORS and date_field != "due_at":
                 return None
-        
-        # Phase 1: Upcoming/Due Soon (with values)
-        elif operator in ["due_in_days", "due_within_days", "due_in_more_than_days"]:
             try:
                 days = int(values[0])
-                today = datetime.now(timezone.utc).date()
-                
-                if operator == "due_in_days":
-                    # Due in exactly N days
-                    target_date = today + timedelta(days=days)
-                    start_of_day = datetime.combine(target_date, datetime.min.time()).replace(tzinfo=timezone.utc)
-                    end_of_day = datetime.combine(target_date, datetime.max.time()).replace(tzinfo=timezone.utc)
-                    return and_(
-                        base_condition,
-                        Node.id.in_(
-                            select(Task.id).where(
-                                and_(
-                                    getattr(Task, date_field) >= start_of_day,
-                                    getattr(Task, date_field) <= end_of_day
-                                )
-                            )
-                        )
-                    )
-                elif operator == "due_within_days":
-                    # Due within next N days (includes today)
-                    today_start = datetime.combine(today, datetime.min.time()).replace(tzinfo=timezone.utc)
-                    end_date = today + timedelta(days=days)
-                    end_of_period = datetime.combine(end_date, datetime.max.time()).replace(tzinfo=timezone.utc)
-                    return and_(
-                        base_condition,
-                        Node.id.in_(
-                            select(Task.id).where(
-                                and_(
-                                    getattr(Task, date_field).is_not(None),
-                                    getattr(Task, date_field) >= today_start,
-                                    getattr(Task, date_field) <= end_of_period
-                                )
-                            )
-                        )
-                    )
-                elif operator == "due_in_more_than_days":
-                    # Due more than N days from now
-                    cutoff_date = today + timedelta(days=days)
-                    cutoff_end = datetime.combine(cutoff_date, datetime.max.time()).replace(tzinfo=timezone.utc)
-                    return and_(
-                        base_condition,
-                        Node.id.in_(
-                            select(Task.id).where(
-                                and_(
-                                    getattr(Task, date_field).is_not(None),
-                                    getattr(Task, date_field) > cutoff_end
-                                )
-                            )
-                        )
-                    )
             except (ValueError, TypeError):
                 return None
+            return self._task_condition(*day_count_predicates(ctx, column, days))
         
-        # Phase 2: Relative Date Ranges (with values)
-        elif operator in ["within_last_days", "more_than_days_ago", "exactly_days_ago", 
-                         "within_next_days", "starts_within_days", "starts_in_more_than_days"]:
-            try:
-                days = int(values[0])
-                today = datetime.now(timezone.utc).date()
-                
-                if operator == "within_last_days":
-                    # Date within last N days (includes today)
-                    start_date = today - timedelta(days=days)
-                    start_of_period = datetime.combine(start_date, datetime.min.time()).replace(tzinfo=timezone.utc)
-                    today_end = datetime.combine(today, datetime.max.time()).replace(tzinfo=timezone.utc)
-                    return and_(
-                        base_condition,
-                        Node.id.in_(
-                            select(Task.id).where(
-                                and_(
-                                    getattr(Task, date_field).is_not(None),
-                                    getattr(Task, date_field) >= start_of_period,
-                                    getattr(Task, date_field) <= today_end
-                                )
-                            )
-                        )
-                    )
-                elif operator == "more_than_days_ago":
-                    # Date more than N days ago
-                    cutoff_date = today - timedelta(days=days)
-                    cutoff_start = datetime.combine(cutoff_date, datetime.min.time()).replace(tzinfo=timezone.utc)
-                    return and_(
-                        base_condition,
-                        Node.id.in_(
-                            select(Task.id).where(
-                                and_(
-                                    getattr(Task, date_field).is_not(None),
-                                    getattr(Task, date_field) < cutoff_start
-                                )
-                            )
-                        )
-                    )
-                elif operator == "exactly_days_ago":
-                    # Date exactly N days ago
-                    target_date = today - timedelta(days=days)
-                    start_of_day = datetime.combine(target_date, datetime.min.time()).replace(tzinfo=timezone.utc)
-                    end_of_day = datetime.combine(target_date, datetime.max.time()).replace(tzinfo=timezone.utc)
-                    return and_(
-                        base_condition,
-                        Node.id.in_(
-                            select(Task.id).where(
-                                and_(
-                                    getattr(Task, date_field) >= start_of_day,
-                                    getattr(Task, date_field) <= end_of_day
-                                )
-                            )
-                        )
-                    )
-                elif operator == "within_next_days":
-                    # Date within next N days (includes today)
-                    today_start = datetime.combine(today, datetime.min.time()).replace(tzinfo=timezone.utc)
-                    end_date = today + timedelta(days=days)
-                    end_of_period = datetime.combine(end_date, datetime.max.time()).replace(tzinfo=timezone.utc)
-                    return and_(
-                        base_condition,
-                        Node.id.in_(
-                            select(Task.id).where(
-                                and_(
-                                    getattr(Task, date_field).is_not(None),
-                                    getattr(Task, date_field) >= today_start,
-                                    getattr(Task, date_field) <= end_of_period
-                                )
-                            )
-                        )
-                    )
-                elif operator in ["starts_within_days", "starts_in_more_than_days"]:
-                    # These are aliases for due date logic but more semantic for start dates
-                    if operator == "starts_within_days":
-                        today_start = datetime.combine(today, datetime.min.time()).replace(tzinfo=timezone.utc)
-                        end_date = today + timedelta(days=days)
-                        end_of_period = datetime.combine(end_date, datetime.max.time()).replace(tzinfo=timezone.utc)
-                        return and_(
-                            base_condition,
-                            Node.id.in_(
-                                select(Task.id).where(
-                                    and_(
-                                        getattr(Task, date_field).is_not(None),
-                                        getattr(Task, date_field) >= today_start,
-                                        getattr(Task, date_field) <= end_of_period
-                                    )
-                                )
-                            )
-                        )
-                    else:  # starts_in_more_than_days
-                        cutoff_date = today + timedelta(days=days)
-                        cutoff_end = datetime.combine(cutoff_date, datetime.max.time()).replace(tzinfo=timezone.utc)
-                        return and_(
-                            base_condition,
-                            Node.id.in_(
-                                select(Task.id).where(
-                                    and_(
-                                        getattr(Task, date_field).is_not(None),
-                                        getattr(Task, date_field) > cutoff_end
-                                    )
-                                )
-                            )
-                        )
-            except (ValueError, TypeError):
-                return None
-            
         try:
-            date_value = datetime.fromisoformat(values[0]).replace(tzinfo=None)
+            date_value = _parse_rule_datetime(values[0])
             
             if operator == "on":
                 # On specific date (comparing just the date part)
-                next_day = date_value.replace(hour=23, minute=59, second=59)
-                start_day = date_value.replace(hour=0, minute=0, second=0)
-                return and_(
-                    base_condition,
-                    Node.id.in_(
-                        select(Task.id).where(
-                            and_(
-                                getattr(Task, date_field) >= start_day,
-                                getattr(Task, date_field) <= next_day
-                            )
-                        )
-                    )
+                start_day = datetime(date_value.year, date_value.month, date_value.day)
+                return self._task_condition(
+                    column >= start_day,
+                    column < start_day + timedelta(days=1),
                 )
                 
             elif operator == "before":
-                return and_(
-                    base_condition,
-                    Node.id.in_(
-                        select(Task.id).where(
-                            getattr(Task, date_field) < date_value
-                        )
-                    )
-                )
+                return self._task_condition(column < date_value)
                 
             elif operator == "after":
-                return and_(
-                    base_condition,
-                    Node.id.in_(
-                        select(Task.id).where(
-                            getattr(Task, date_field) > date_value
-                        )
-                    )
-                )
+                return self._task_condition(column > date_value)
                 
             elif operator == "between" and len(values) >= 2 and values[1]:
-                end_date = datetime.fromisoformat(values[1]).replace(tzinfo=None)
-                return and_(
-                    base_condition,
-                    Node.id.in_(
-                        select(Task.id).where(
-                            and_(
-                                getattr(Task, date_field) >= date_value,
-                                getattr(Task, date_field) <= end_date
-                            )
-                        )
-                    )
+                end_date = _parse_rule_datetime(values[1])
+                return self._task_condition(
+                    column >= date_value,
+                    column <= end_date,
                 )
                 
         except (ValueError, TypeError):
@@ -840,7 +770,24 @@ class SmartFolderRulesEngine:
         return None
     
     def validate_rules(self, rules: Dict[str, Any]) -> List[str]:
-        """Validate smart folder rules and return list of errors"""
+        """Validate smart folder rules and return list of errors
+        
+        Well-formed rules are accepted by the compiled SmartFolderRules schema
+        plus the operator/values pairing check; only rules that fail it are
+        walked condition by condition to describe the problems.
+        """
+        try:
+            parsed = SmartFolderRules.model_validate(rules)
+        except ValidationError as exc:
+            return self._describe_rule_errors(rules) or [
+                f"{'.'.join(map(str, e['loc']))}: {e['msg']}" for e in exc.errors()
+            ]
+        if all(c.operator and (c.values or c.operator in NO_VALUES_OPERATORS) for c in parsed.conditions):
+            return []
+        return self._describe_rule_errors(rules)
+    
+    @staticmethod
+    def _describe_rule_errors(rules: Dict[str, Any]) -> List[str]:
         errors = []
         
         if not isinstance(rules, dict):
@@ -853,7 +800,7 @@ class SmartFolderRulesEngine:
             return errors
         
         logic = rules.get("logic", "AND")
-        if logic not in ("AND", "OR"):
+        if logic not in RULE_LOGICS:
             errors.append("Logic must be 'AND' or 'OR'")
         
         for i, condition in enumerate(conditions):
@@ -866,12 +813,7 @@ class SmartFolderRulesEngine:
                 errors.append(f"Condition {i+1} missing 'type' field")
                 continue
             
-            valid_types = [
-                "tag_contains", "node_type", "parent_node", "parent_ancestor",
-                "task_status", "task_priority", "title_contains", "has_children",
-                "due_date", "earliest_start", "saved_filter"
-            ]
-            if condition_type not in valid_types:
+            if condition_type not in CONDITION_TYPES:
                 errors.append(f"Condition {i+1} has invalid type: {condition_type}")
             
             operator = condition.get("operator")
@@ -884,9 +826,7 @@ class SmartFolderRulesEngine:
                 errors.append(f"Condition {i+1} 'values' must be a list")
                 continue
                 
-            # Some operators don't require values (e.g., is_today, is_null, is_not_null)
-            no_values_operators = ["is_today", "is_null", "is_not_null", "is_overdue", "this_week", "next_week", "this_month", "yesterday", "tomorrow"]
-            if operator not in no_values_operators and not values:
+            if operator not in NO_VALUES_OPERATORS and not values:
                 errors.append(f"Condition {i+1} must have non-empty 'values' list")
         
         return errors
\ No newline at end of file
@@ -0,0 +1,67 @@
+"""
+Direct JSON encoding for trusted rows.
+
+Rows read from our own queries are already well-typed, so internal
+ORM/row -> JSON paths skip Pydantic and hand plain dicts to orjson's C encoder.
+Pydantic is still used to parse inbound data and to describe responses in OpenAPI.
+"""
+from enum import Enum
+from functools import cache
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Mapping, Tuple
+
+import orjson
+from pydantic import BaseModel
+
+
+ORJSON_OPTS = orjson.OPT_SERIALIZE_UUID | orjson.OPT_NAIVE_UTC
+# Response models: write UTC as "Z" like Pydantic's dump_json did
+ORJSON_MODEL_OPTS = ORJSON_OPTS | orjson.OPT_UTC_Z
+
+# Rows encoded per chunk when streaming; one ASGI send per row would dominate
+STREAM_CHUNK_ROWS = 500
+
+
+@cache
+def _field_names(model_class: type) -> Tuple[str, ...]:
+    return tuple(model_class.model_fields)
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, BaseModel):
+        # Already-validated response models: read the stored field values, no
+        # schema walk (and no deprecated-field warnings from attribute access).
+        # Assumes no field serializers or aliases; see tests/utils/test_serialize.py
+        values = obj.__dict__
+        return {name: values[name] for name in _field_names(type(obj))}
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def serialize_node_row(row_mapping: Mapping[str, Any]) -> bytes:
+    """Encode a row mapping (e.g. ``Row._mapping`` or a dict built from one)"""
+    return orjson.dumps(row_mapping, default=_default, option=ORJSON_OPTS)
+
+
+def serialize_models(models: Iterable[BaseModel]) -> bytes:
+    """Encode a list of response models (nested models included) as a JSON array"""
+    return orjson.dumps(list(models), default=_default, option=ORJSON_MODEL_OPTS)
+
+
+async def stream_tree(root_id: Any, items: AsyncIterable[Mapping[str, Any]]) -> AsyncIterator[bytes]:
+    """Encode a NodeTree body incrementally as ``items`` rows arrive.
+
+    total_count is written after the items, once they have been counted.
+    """
+    yield b'{"root_id":' + orjson.dumps(root_id, option=ORJSON_OPTS) + b',"items":['
+    count = 0
+    chunk = []
+    async for item in items:
+        chunk.append(serialize_node_row(item))
+        count += 1
+        if len(chunk) >= STREAM_CHUNK_ROWS:
+            yield (b"," if count > len(chunk) else b"") + b",".join(chunk)
+            chunk = []
+    if chunk:
+        yield (b"," if count > len(chunk) else b"") + b",".join(chunk)
+    yield b'],"total_count":' + str(count).encode() + b"}"
@@ -0,0 +1,27 @@
+"""
+Time-ordered UUID (version 7) generation.
+
+Random v4 ids scatter inserts across the whole primary key B-tree. v7 ids
+start with a millisecond timestamp, so new rows land on the rightmost leaf
+page and the id indexes stay compact.
+"""
+import os
+import time
+import uuid
+
+
+def gen_uuid_v7() -> uuid.UUID:
+    """Return a new RFC 9562 version 7 UUID.
+
+    Layout: 48-bit unix_ts_ms | 4-bit version | 12-bit rand_a | 2-bit variant | 62-bit rand_b
+    """
+    unix_ts_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    rand_a = rand >> 68
+    rand_b = rand & ((1 << 62) - 1)
+    value = (unix_ts_ms & ((1 << 48) - 1)) << 80
+    value |= 0x7 << 76
+    value |= rand_a << 64
+    value |= 0b10 << 62
+    value |= rand_b
+    return uuid.UUID(int=value)
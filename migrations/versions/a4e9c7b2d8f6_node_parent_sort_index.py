@@ -0,0 +1,28 @@
+"""Replace ix_node_parent with a (parent_id, sort_order, created_at) index
+
+Revision ID: a4e9c7b2d8f6
+Revises: f3b8d2c6a9e1
+Create Date: 2025-10-06 10:41:27.583019
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4e9c7b2d8f6'
+down_revision: Union[str, None] = 'f3b8d2c6a9e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_node_parent', table_name='nodes')
+    op.create_index('ix_node_parent_sort', 'nodes', ['parent_id', 'sort_order', 'created_at'], postgresql_using='btree')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_node_parent_sort', table_name='nodes')
+    op.create_index('ix_node_parent', 'nodes', ['parent_id'])
@@ -0,0 +1,31 @@
+"""Composite indexes for smart folder base filters
+
+Revision ID: a7c3e9f1b2d4
+Revises: d9f4a1c7e3b6
+Create Date: 2025-10-06 16:40:12.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e9f1b2d4'
+down_revision: Union[str, None] = 'd9f4a1c7e3b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_nodes_owner_parent', 'nodes', ['owner_id', 'parent_id'])
+    op.create_index('ix_nodes_owner_type', 'nodes', ['owner_id', 'node_type'])
+    # Created on the partitioned parent, so every node_tags partition gets one
+    op.create_index('ix_node_tags_tag_node', 'node_tags', ['tag_id', 'node_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_node_tags_tag_node', table_name='node_tags')
+    op.drop_index('ix_nodes_owner_type', table_name='nodes')
+    op.drop_index('ix_nodes_owner_parent', table_name='nodes')
@@ -0,0 +1,30 @@
+"""Combine task status and priority indexes
+
+Revision ID: a8c2d5e9f3b1
+Revises: f1d7e3a9b5c6
+Create Date: 2025-10-04 16:55:03.118274
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8c2d5e9f3b1'
+down_revision: Union[str, None] = 'f1d7e3a9b5c6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_task_status', table_name='node_tasks')
+    op.drop_index('ix_task_priority', table_name='node_tasks')
+    op.create_index('ix_task_status_priority', 'node_tasks', ['status', 'priority'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_task_status_priority', table_name='node_tasks')
+    op.create_index('ix_task_priority', 'node_tasks', ['priority'])
+    op.create_index('ix_task_status', 'node_tasks', ['status'])
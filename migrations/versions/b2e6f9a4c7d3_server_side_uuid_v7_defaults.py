@@ -0,0 +1,53 @@
+"""Generate UUIDv7 primary keys server-side
+
+Revision ID: b2e6f9a4c7d3
+Revises: a8c2d5e9f3b1
+Create Date: 2025-10-05 10:03:44.590218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2e6f9a4c7d3'
+down_revision: Union[str, None] = 'a8c2d5e9f3b1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Tables whose "id" primary key is generated (subtype tables share nodes.id)
+TABLES = ['nodes', 'tags', 'artifacts', 'rules']
+
+
+def upgrade() -> None:
+    # Same layout as app.utils.uuid7.gen_uuid_v7: 48-bit unix ms timestamp over a
+    # random v4 uuid, with the version nibble flipped from 4 to 7.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION gen_uuid_v7() RETURNS uuid AS $$
+            SELECT encode(
+                set_bit(
+                    set_bit(
+                        overlay(
+                            uuid_send(gen_random_uuid())
+                            PLACING substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                            FROM 1 FOR 6
+                        ),
+                        52, 1
+                    ),
+                    53, 1
+                ),
+                'hex'
+            )::uuid
+        $$ LANGUAGE sql VOLATILE
+    """)
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=sa.text('gen_uuid_v7()'))
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=None)
+    op.execute("DROP FUNCTION IF EXISTS gen_uuid_v7()")
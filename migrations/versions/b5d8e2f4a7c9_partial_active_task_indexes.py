@@ -0,0 +1,41 @@
+"""Partial indexes for open and due tasks
+
+Revision ID: b5d8e2f4a7c9
+Revises: a4e9c7b2d8f6
+Create Date: 2025-10-06 11:58:03.472916
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5d8e2f4a7c9'
+down_revision: Union[str, None] = 'a4e9c7b2d8f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_task_active',
+        'node_tasks',
+        ['priority', 'due_at'],
+        postgresql_where=sa.text("archived = false AND status <> 'done'"),
+    )
+    # Replaces the full due_at index, which was mostly NULLs
+    op.create_index(
+        'ix_task_due_soon',
+        'node_tasks',
+        ['due_at'],
+        postgresql_where=sa.text("due_at IS NOT NULL AND archived = false"),
+    )
+    op.drop_index('ix_task_due_at', table_name='node_tasks')
+
+
+def downgrade() -> None:
+    op.create_index('ix_task_due_at', 'node_tasks', ['due_at'])
+    op.drop_index('ix_task_due_soon', table_name='node_tasks')
+    op.drop_index('ix_task_active', table_name='node_tasks')
@@ -0,0 +1,77 @@
+"""Add child_count to nodes
+
+Revision ID: b7e1d4a9c2f3
+Revises: 01bec7ba3aa3
+Create Date: 2025-10-02 10:14:08.512904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e1d4a9c2f3'
+down_revision: Union[str, None] = '01bec7ba3aa3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('nodes', sa.Column('child_count', sa.Integer(), server_default='0', nullable=False))
+
+    # Backfill from the current hierarchy
+    op.execute("""
+        UPDATE nodes AS p
+        SET child_count = c.cnt
+        FROM (
+            SELECT parent_id, COUNT(*) AS cnt
+            FROM nodes
+            WHERE parent_id IS NOT NULL
+            GROUP BY parent_id
+        ) AS c
+        WHERE p.id = c.parent_id
+    """)
+
+    # Keep the counter in sync on insert, delete and re-parenting
+    op.execute("""
+        CREATE OR REPLACE FUNCTION nodes_child_count() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.parent_id IS NOT NULL THEN
+                UPDATE nodes SET child_count = child_count + 1 WHERE id = NEW.parent_id;
+            END IF;
+            IF TG_OP IN ('DELETE', 'UPDATE') AND OLD.parent_id IS NOT NULL THEN
+                UPDATE nodes SET child_count = child_count - 1 WHERE id = OLD.parent_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER nodes_child_count_ins_del
+        AFTER INSERT OR DELETE ON nodes
+        FOR EACH ROW EXECUTE FUNCTION nodes_child_count()
+    """)
+    op.execute("""
+        CREATE TRIGGER nodes_child_count_move
+        AFTER UPDATE OF parent_id ON nodes
+        FOR EACH ROW
+        WHEN (OLD.parent_id IS DISTINCT FROM NEW.parent_id)
+        EXECUTE FUNCTION nodes_child_count()
+    """)
+
+    op.create_index(
+        'ix_node_is_list',
+        'nodes',
+        ['parent_id'],
+        postgresql_where=sa.text('child_count > 0'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_node_is_list', table_name='nodes')
+    op.execute("DROP TRIGGER IF EXISTS nodes_child_count_move ON nodes")
+    op.execute("DROP TRIGGER IF EXISTS nodes_child_count_ins_del ON nodes")
+    op.execute("DROP FUNCTION IF EXISTS nodes_child_count()")
+    op.drop_column('nodes', 'child_count')
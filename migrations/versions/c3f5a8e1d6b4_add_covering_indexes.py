@@ -0,0 +1,51 @@
+"""Add covering and partial indexes for node, task and artifact listings
+
+Revision ID: c3f5a8e1d6b4
+Revises: b7e1d4a9c2f3
+Create Date: 2025-10-02 15:41:27.093316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f5a8e1d6b4'
+down_revision: Union[str, None] = 'b7e1d4a9c2f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Owner listings can be answered from the index alone (index-only scan)
+    op.drop_index('ix_node_owner_sort', table_name='nodes')
+    op.create_index(
+        'ix_node_owner_sort_covering',
+        'nodes',
+        ['owner_id', 'sort_order'],
+        postgresql_include=['title', 'node_type', 'parent_id'],
+    )
+
+    op.create_index(
+        'ix_artifact_node_created',
+        'artifacts',
+        ['node_id', 'created_at'],
+        postgresql_include=['filename', 'size_bytes'],
+    )
+
+    # Active-task queries never look at archived rows
+    op.create_index(
+        'ix_task_status_due',
+        'node_tasks',
+        ['status', 'due_at'],
+        postgresql_where=sa.text('archived = false'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_task_status_due', table_name='node_tasks')
+    op.drop_index('ix_artifact_node_created', table_name='artifacts')
+    op.drop_index('ix_node_owner_sort_covering', table_name='nodes')
+    op.create_index('ix_node_owner_sort', 'nodes', ['owner_id', 'sort_order'])
@@ -0,0 +1,28 @@
+"""Trigram index for node title search
+
+Revision ID: c4e8a2d6f1b9
+Revises: a7c3e9f1b2d4
+Create Date: 2025-10-06 18:05:41.207316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e8a2d6f1b9'
+down_revision: Union[str, None] = 'a7c3e9f1b2d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Serves the smart folder "title contains" filter: lower(title) LIKE '%...%'
+    op.execute("CREATE INDEX ix_nodes_title_trgm ON nodes USING gin (lower(title) gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    op.drop_index('ix_nodes_title_trgm', table_name='nodes')
@@ -0,0 +1,44 @@
+"""Store tags.color as a packed 0xRRGGBB integer
+
+Revision ID: c6d1e8a2f4b9
+Revises: b2e6f9a4c7d3
+Create Date: 2025-10-05 11:27:12.804631
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6d1e8a2f4b9'
+down_revision: Union[str, None] = 'b2e6f9a4c7d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Anything that is not a valid "#rrggbb" code becomes NULL
+    op.alter_column(
+        'tags',
+        'color',
+        type_=sa.Integer(),
+        existing_type=sa.String(length=7),
+        existing_nullable=True,
+        postgresql_using=(
+            "CASE WHEN color ~ '^#[0-9a-fA-F]{6}$' "
+            "THEN ('x' || substr(color, 2))::bit(24)::integer END"
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'tags',
+        'color',
+        type_=sa.String(length=7),
+        existing_type=sa.Integer(),
+        existing_nullable=True,
+        postgresql_using="'#' || lpad(to_hex(color), 6, '0')",
+    )
@@ -0,0 +1,65 @@
+"""Store rule definitions as JSONB
+
+Revision ID: d9a2b6f4e1c8
+Revises: c3f5a8e1d6b4
+Create Date: 2025-10-03 09:22:51.640187
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9a2b6f4e1c8'
+down_revision: Union[str, None] = 'c3f5a8e1d6b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'rules',
+        'rule_data',
+        type_=postgresql.JSONB(),
+        existing_type=sa.JSON(),
+        existing_nullable=False,
+        postgresql_using='rule_data::jsonb',
+    )
+    op.alter_column(
+        'node_smart_folders',
+        'rules',
+        type_=postgresql.JSONB(),
+        existing_type=sa.JSON(),
+        existing_nullable=True,
+        postgresql_using='rules::jsonb',
+    )
+    op.create_index(
+        'ix_rules_data_gin',
+        'rules',
+        ['rule_data'],
+        postgresql_using='gin',
+        postgresql_ops={'rule_data': 'jsonb_path_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_rules_data_gin', table_name='rules')
+    op.alter_column(
+        'node_smart_folders',
+        'rules',
+        type_=sa.JSON(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=True,
+        postgresql_using='rules::json',
+    )
+    op.alter_column(
+        'rules',
+        'rule_data',
+        type_=sa.JSON(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=False,
+        postgresql_using='rule_data::json',
+    )
@@ -0,0 +1,91 @@
+"""Store task status and priority as SMALLINT codes
+
+Revision ID: d9f4a1c7e3b6
+Revises: b5d8e2f4a7c9
+Create Date: 2025-10-06 14:22:41.903518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9f4a1c7e3b6'
+down_revision: Union[str, None] = 'b5d8e2f4a7c9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Must match TaskStatusCode / TaskPriorityCode in app.models.enums
+STATUS_CODES = {'todo': 0, 'in_progress': 1, 'done': 2, 'dropped': 3}
+PRIORITY_CODES = {'low': 0, 'medium': 1, 'high': 2, 'urgent': 3}
+
+
+def _to_code(column: str, codes: dict) -> str:
+    whens = " ".join(f"WHEN '{name}' THEN {code}" for name, code in codes.items())
+    return f"CASE {column}::text {whens} END"
+
+
+def _to_name(column: str, enum_name: str, codes: dict) -> str:
+    whens = " ".join(f"WHEN {code} THEN '{name}'" for name, code in codes.items())
+    return f"(CASE {column} {whens} END)::{enum_name}"
+
+
+def upgrade() -> None:
+    # The partial index predicate compares against the enum type; rebuild it afterwards
+    op.drop_index('ix_task_active', table_name='node_tasks')
+
+    for column, codes, default in (
+        ('status', STATUS_CODES, 'todo'),
+        ('priority', PRIORITY_CODES, 'medium'),
+    ):
+        op.alter_column('node_tasks', column, server_default=None)
+        op.alter_column(
+            'node_tasks', column,
+            type_=sa.SmallInteger(),
+            postgresql_using=_to_code(column, codes),
+        )
+        op.alter_column('node_tasks', column, server_default=sa.text(str(codes[default])))
+
+    op.create_check_constraint('ck_node_tasks_status_code', 'node_tasks', f"status BETWEEN 0 AND {max(STATUS_CODES.values())}")
+    op.create_check_constraint('ck_node_tasks_priority_code', 'node_tasks', f"priority BETWEEN 0 AND {max(PRIORITY_CODES.values())}")
+
+    op.create_index(
+        'ix_task_active',
+        'node_tasks',
+        ['priority', 'due_at'],
+        postgresql_where=sa.text(f"archived = false AND status <> {STATUS_CODES['done']}"),
+    )
+
+    op.execute("DROP TYPE IF EXISTS task_status")
+    op.execute("DROP TYPE IF EXISTS task_priority")
+
+
+def downgrade() -> None:
+    op.execute("CREATE TYPE task_status AS ENUM ('todo', 'in_progress', 'done', 'dropped')")
+    op.execute("CREATE TYPE task_priority AS ENUM ('low', 'medium', 'high', 'urgent')")
+
+    op.drop_index('ix_task_active', table_name='node_tasks')
+    op.drop_constraint('ck_node_tasks_priority_code', 'node_tasks', type_='check')
+    op.drop_constraint('ck_node_tasks_status_code', 'node_tasks', type_='check')
+
+    for column, enum_name, codes, default in (
+        ('status', 'task_status', STATUS_CODES, 'todo'),
+        ('priority', 'task_priority', PRIORITY_CODES, 'medium'),
+    ):
+        op.alter_column('node_tasks', column, server_default=None)
+        op.alter_column(
+            'node_tasks', column,
+            type_=sa.Enum(*codes, name=enum_name, create_type=False),
+            postgresql_using=_to_name(column, enum_name, codes),
+        )
+        op.alter_column('node_tasks', column, server_default=default)
+
+    op.create_index(
+        'ix_task_active',
+        'node_tasks',
+        ['priority', 'due_at'],
+        postgresql_where=sa.text("archived = false AND status <> 'done'"),
+    )
@@ -0,0 +1,48 @@
+"""Partial indexes for smart folder base query and date conditions, node index cleanup
+
+Revision ID: e2b7f4c9a1d5
+Revises: c4e8a2d6f1b9
+Create Date: 2025-10-07 09:12:36.440918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b7f4c9a1d5'
+down_revision: Union[str, None] = 'c4e8a2d6f1b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # node_type is stored as SMALLINT; 5 is NodeType.template
+    op.create_index(
+        'ix_node_owner_type_parent',
+        'nodes',
+        ['owner_id', 'node_type', 'parent_id'],
+        postgresql_where=sa.text('node_type <> 5'),
+    )
+    # Same leading columns; the smart folder base query always excludes templates
+    op.drop_index('ix_nodes_owner_type', table_name='nodes')
+    # Hand-named node indexes use the ix_node_ prefix
+    op.execute("ALTER INDEX ix_nodes_owner_parent RENAME TO ix_node_owner_parent")
+    op.execute("ALTER INDEX ix_nodes_title_trgm RENAME TO ix_node_title_trgm")
+    # due_at is already covered by ix_task_due_soon (b5d8e2f4a7c9)
+    op.create_index(
+        'ix_task_earliest_start_at',
+        'node_tasks',
+        ['earliest_start_at'],
+        postgresql_where=sa.text('earliest_start_at IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_task_earliest_start_at', table_name='node_tasks')
+    op.execute("ALTER INDEX ix_node_title_trgm RENAME TO ix_nodes_title_trgm")
+    op.execute("ALTER INDEX ix_node_owner_parent RENAME TO ix_nodes_owner_parent")
+    op.create_index('ix_nodes_owner_type', 'nodes', ['owner_id', 'node_type'])
+    op.drop_index('ix_node_owner_type_parent', table_name='nodes')
@@ -0,0 +1,53 @@
+"""Store nodes.node_type as SMALLINT
+
+Revision ID: e4b8c1f7a3d2
+Revises: d9a2b6f4e1c8
+Create Date: 2025-10-03 14:08:36.217459
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4b8c1f7a3d2'
+down_revision: Union[str, None] = 'd9a2b6f4e1c8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Must match app.models.enums.NodeType
+NODE_TYPE_CODES = {
+    'node': 0,
+    'task': 1,
+    'note': 2,
+    'folder': 3,
+    'smart_folder': 4,
+    'template': 5,
+}
+
+
+def upgrade() -> None:
+    cases = " ".join(f"WHEN '{name}' THEN {code}" for name, code in NODE_TYPE_CODES.items())
+    op.alter_column(
+        'nodes',
+        'node_type',
+        type_=sa.SmallInteger(),
+        existing_type=sa.String(length=20),
+        existing_nullable=False,
+        postgresql_using=f"CASE node_type {cases} END",
+    )
+
+
+def downgrade() -> None:
+    cases = " ".join(f"WHEN {code} THEN '{name}'" for name, code in NODE_TYPE_CODES.items())
+    op.alter_column(
+        'nodes',
+        'node_type',
+        type_=sa.String(length=20),
+        existing_type=sa.SmallInteger(),
+        existing_nullable=False,
+        postgresql_using=f"CASE node_type {cases} END",
+    )
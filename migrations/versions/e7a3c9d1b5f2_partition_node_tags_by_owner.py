@@ -0,0 +1,66 @@
+"""Hash-partition node_tags by owner_id
+
+Revision ID: e7a3c9d1b5f2
+Revises: c6d1e8a2f4b9
+Create Date: 2025-10-05 14:52:08.311742
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7a3c9d1b5f2'
+down_revision: Union[str, None] = 'c6d1e8a2f4b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Must match app.models.node_associations.NODE_TAGS_PARTITIONS
+PARTITIONS = 16
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE node_tags RENAME TO node_tags_old")
+    op.execute("ALTER INDEX node_tags_pkey RENAME TO node_tags_old_pkey")
+    op.execute("""
+        CREATE TABLE node_tags (
+            owner_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+            node_id UUID NOT NULL REFERENCES nodes(id) ON DELETE CASCADE,
+            tag_id UUID NOT NULL REFERENCES tags(id) ON DELETE CASCADE,
+            PRIMARY KEY (owner_id, node_id, tag_id)
+        ) PARTITION BY HASH (owner_id)
+    """)
+    for remainder in range(PARTITIONS):
+        op.execute(
+            f"CREATE TABLE node_tags_p{remainder} PARTITION OF node_tags "
+            f"FOR VALUES WITH (MODULUS {PARTITIONS}, REMAINDER {remainder})"
+        )
+
+    # Owner is denormalized from the tagged node
+    op.execute("""
+        INSERT INTO node_tags (owner_id, node_id, tag_id)
+        SELECT n.owner_id, nt.node_id, nt.tag_id
+        FROM node_tags_old nt
+        JOIN nodes n ON n.id = nt.node_id
+    """)
+    op.execute("DROP TABLE node_tags_old")
+    op.execute("ANALYZE node_tags")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE node_tags RENAME TO node_tags_partitioned")
+    op.execute("ALTER INDEX node_tags_pkey RENAME TO node_tags_partitioned_pkey")
+    op.create_table(
+        'node_tags',
+        sa.Column('node_id', sa.UUID(), sa.ForeignKey('nodes.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('tag_id', sa.UUID(), sa.ForeignKey('tags.id', ondelete='CASCADE'), primary_key=True),
+    )
+    op.execute("""
+        INSERT INTO node_tags (node_id, tag_id)
+        SELECT node_id, tag_id FROM node_tags_partitioned
+    """)
+    # Dropping the parent drops all of its partitions
+    op.execute("DROP TABLE node_tags_partitioned")
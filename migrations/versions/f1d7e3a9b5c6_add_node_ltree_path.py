@@ -0,0 +1,91 @@
+"""Add materialized ltree path to nodes
+
+Revision ID: f1d7e3a9b5c6
+Revises: e4b8c1f7a3d2
+Create Date: 2025-10-04 11:37:12.804551
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1d7e3a9b5c6'
+down_revision: Union[str, None] = 'e4b8c1f7a3d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS ltree")
+    op.execute("ALTER TABLE nodes ADD COLUMN path ltree")
+
+    # Labels are node ids without dashes (ltree labels are [A-Za-z0-9_])
+    op.execute("""
+        WITH RECURSIVE tree AS (
+            SELECT id, text2ltree(replace(id::text, '-', '')) AS path
+            FROM nodes
+            WHERE parent_id IS NULL
+
+            UNION ALL
+
+            SELECT n.id, t.path || replace(n.id::text, '-', '')
+            FROM nodes n
+            INNER JOIN tree t ON n.parent_id = t.id
+        )
+        UPDATE nodes SET path = tree.path
+        FROM tree
+        WHERE nodes.id = tree.id
+    """)
+    op.execute("ALTER TABLE nodes ALTER COLUMN path SET DEFAULT ''")
+    op.execute("ALTER TABLE nodes ALTER COLUMN path SET NOT NULL")
+
+    # Compute the path of a new or re-parented node from its parent
+    op.execute("""
+        CREATE OR REPLACE FUNCTION nodes_path_set() RETURNS trigger AS $$
+        BEGIN
+            NEW.path := COALESCE(
+                (SELECT path FROM nodes WHERE id = NEW.parent_id),
+                ''::ltree
+            ) || replace(NEW.id::text, '-', '');
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER nodes_path_set
+        BEFORE INSERT OR UPDATE OF parent_id ON nodes
+        FOR EACH ROW EXECUTE FUNCTION nodes_path_set()
+    """)
+
+    # Re-root the subtree under a moved node
+    op.execute("""
+        CREATE OR REPLACE FUNCTION nodes_path_move() RETURNS trigger AS $$
+        BEGIN
+            UPDATE nodes
+            SET path = NEW.path || subpath(path, nlevel(OLD.path))
+            WHERE path <@ OLD.path AND id <> NEW.id;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER nodes_path_move
+        AFTER UPDATE OF parent_id ON nodes
+        FOR EACH ROW
+        WHEN (OLD.parent_id IS DISTINCT FROM NEW.parent_id)
+        EXECUTE FUNCTION nodes_path_move()
+    """)
+
+    op.create_index('ix_node_path_gist', 'nodes', ['path'], postgresql_using='gist')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_node_path_gist', table_name='nodes')
+    op.execute("DROP TRIGGER IF EXISTS nodes_path_move ON nodes")
+    op.execute("DROP TRIGGER IF EXISTS nodes_path_set ON nodes")
+    op.execute("DROP FUNCTION IF EXISTS nodes_path_move()")
+    op.execute("DROP FUNCTION IF EXISTS nodes_path_set()")
+    op.drop_column('nodes', 'path')
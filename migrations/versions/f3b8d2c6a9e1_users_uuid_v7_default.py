@@ -0,0 +1,27 @@
+"""Generate UUIDv7 user ids server-side
+
+Revision ID: f3b8d2c6a9e1
+Revises: e7a3c9d1b5f2
+Create Date: 2025-10-06 09:14:51.207385
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b8d2c6a9e1'
+down_revision: Union[str, None] = 'e7a3c9d1b5f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # gen_uuid_v7() is created in b2e6f9a4c7d3
+    op.alter_column('users', 'id', server_default=sa.text('gen_uuid_v7()'))
+
+
+def downgrade() -> None:
+    op.alter_column('users', 'id', server_default=None)
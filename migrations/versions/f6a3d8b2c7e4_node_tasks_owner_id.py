@@ -0,0 +1,51 @@
+"""Denormalize owner_id onto node_tasks for per-owner date indexes
+
+Revision ID: f6a3d8b2c7e4
+Revises: e2b7f4c9a1d5
+Create Date: 2025-10-07 14:26:03.917254
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6a3d8b2c7e4'
+down_revision: Union[str, None] = 'e2b7f4c9a1d5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('node_tasks', sa.Column('owner_id', postgresql.UUID(as_uuid=True), nullable=True))
+    op.execute("""
+        UPDATE node_tasks t
+        SET owner_id = n.owner_id
+        FROM nodes n
+        WHERE n.id = t.id
+    """)
+    op.alter_column('node_tasks', 'owner_id', nullable=False)
+    op.create_foreign_key(
+        'node_tasks_owner_id_fkey', 'node_tasks', 'users', ['owner_id'], ['id'], ondelete='RESTRICT'
+    )
+    op.create_index('ix_task_owner_due', 'node_tasks', ['owner_id', 'due_at'])
+    op.create_index('ix_task_owner_earliest_start', 'node_tasks', ['owner_id', 'earliest_start_at'])
+    # Date conditions are always owner-scoped now, so the per-owner indexes
+    # serve them; the single-column one from e2b7f4c9a1d5 is redundant
+    op.drop_index('ix_task_earliest_start_at', table_name='node_tasks')
+
+
+def downgrade() -> None:
+    op.create_index(
+        'ix_task_earliest_start_at',
+        'node_tasks',
+        ['earliest_start_at'],
+        postgresql_where=sa.text('earliest_start_at IS NOT NULL'),
+    )
+    op.drop_index('ix_task_owner_earliest_start', table_name='node_tasks')
+    op.drop_index('ix_task_owner_due', table_name='node_tasks')
+    op.drop_constraint('node_tasks_owner_id_fkey', 'node_tasks', type_='foreignkey')
+    op.drop_column('node_tasks', 'owner_id')
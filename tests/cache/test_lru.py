@@ -0,0 +1,23 @@
+from app.cache.lru import LRUCache, TTLCache
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get_many(["a", "b", "c"]) == {"a": 1, "c": 3}
+    assert len(cache) == 2
+
+
+def test_ttl_cache_expires_entries():
+    now = [0.0]
+    cache = TTLCache(maxsize=10, ttl=5, timer=lambda: now[0])
+    cache.set("a", 1)
+    now[0] = 4.9
+    assert cache.get("a") == 1
+    now[0] = 5.0
+    assert cache.get("a") is None
+    assert len(cache) == 0
@@ -1,7 +1,11 @@
+from contextlib import contextmanager
+
 import pytest
 from httpx import AsyncClient, ASGITransport
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.pool import NullPool
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, raiseload
 
 from app.main import create_app
 from app.db.session import Base
@@ -57,4 +61,67 @@ async def override_get_db_fixture(app_instance, test_db_session):
 
     app_instance.dependency_overrides[get_db] = _get_test_db
     yield
-    app_instance.dependency_overrides.clear()
\ No newline at end of file
+    app_instance.dependency_overrides.clear()
+
+
+@pytest.fixture(name="count_queries")
+def count_queries_fixture():
+    """Record every SQL statement an engine emits inside the ``with`` block."""
+
+    @contextmanager
+    def _count_queries(engine):
+        sync_engine = getattr(engine, "sync_engine", engine)
+        statements = []
+
+        def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", _before_cursor_execute)
+
+    return _count_queries
+
+
+def _lazy_select_raiseloads(statement):
+    """raiseload() options for the default (lazy="select") relationships of a statement's entities"""
+    options = []
+    for description in statement.column_descriptions:
+        entity = description.get("entity")
+        # Whole-entity columns only; select(User.id) has no relationships to load
+        if entity is None or description["expr"] is not entity:
+            continue
+        for rel in inspect(entity).relationships:
+            if rel.lazy == "select":
+                options.append(raiseload(getattr(entity, rel.key)))
+    return options
+
+
+@pytest.fixture(autouse=True)
+def raise_on_lazy_load():
+    """Fail any test whose ORM queries lazy-load a relationship it did not load explicitly.
+
+    Adds ``raiseload()`` for the default lazy="select" relationships of the
+    entities of every top-level ORM SELECT. Loading strategies configured on
+    the model (selectin, joined, raise_on_sql) are left alone, and loader
+    options on the statement itself (selectinload, joinedload, ...) still take
+    precedence.
+    """
+
+    def _do_orm_execute(orm_execute_state):
+        if (
+            orm_execute_state.is_select
+            and not orm_execute_state.is_column_load
+            and not orm_execute_state.is_relationship_load
+        ):
+            options = _lazy_select_raiseloads(orm_execute_state.statement)
+            if options:
+                orm_execute_state.statement = orm_execute_state.statement.options(*options)
+
+    event.listen(Session, "do_orm_execute", _do_orm_execute)
+    try:
+        yield
+    finally:
+        event.remove(Session, "do_orm_execute", _do_orm_execute)
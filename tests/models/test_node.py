@@ -0,0 +1,147 @@
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import Session, selectin_polymorphic, selectinload
+
+from app.db.session import Base
+from app.models.user import User
+from app.models.node import Node, Task, Note, Folder, SmartFolder, Template
+from app.models.tag import Tag
+from app.models.rule import Rule
+from app.models.artifact import Artifact
+from app.models.default_node import DefaultNode
+from app.models.enums import NodeType, TaskPriority, TaskPriorityCode, TaskStatus, TaskStatusCode
+
+
+@pytest.fixture
+def node_engine():
+    engine = create_engine("sqlite://")
+    tables = [
+        User.__table__,
+        Rule.__table__,
+        Node.__table__,
+        Task.__table__,
+        Note.__table__,
+        Folder.__table__,
+        SmartFolder.__table__,
+        Template.__table__,
+        Tag.__table__,
+        Base.metadata.tables["node_tags"],
+        Artifact.__table__,
+        DefaultNode.__table__,
+    ]
+    Base.metadata.create_all(engine, tables=tables)
+    with Session(engine) as session:
+        user = User(email="nodes@example.com", password_hash="x")
+        session.add(user)
+        session.flush()
+        folder = Folder(owner_id=user.id, title="Inbox")
+        session.add(folder)
+        session.flush()
+        session.add_all([
+            Task(owner_id=user.id, parent_id=folder.id, title="Task"),
+            Note(owner_id=user.id, parent_id=folder.id, title="Note", body="body"),
+        ])
+        session.commit()
+    yield engine
+    engine.dispose()
+
+
+def test_mixed_node_listing_loads_one_query_per_subtype(node_engine, count_queries):
+    loader = selectin_polymorphic(Node, [Task, Note, Folder, SmartFolder, Template])
+    with Session(node_engine) as session, count_queries(node_engine) as statements:
+        nodes = session.execute(select(Node).options(loader).order_by(Node.title)).scalars().all()
+        assert {type(n) for n in nodes} == {Folder, Task, Note}
+        task = next(n for n in nodes if isinstance(n, Task))
+        assert task.status is not None
+    # base query + one IN query for each subtype present
+    assert len(statements) == 1 + 3
+
+
+def test_node_collections_do_not_lazy_load(node_engine):
+    with Session(node_engine) as session:
+        folder = session.execute(select(Folder)).scalar_one()
+        with pytest.raises(InvalidRequestError):
+            folder.children
+        with pytest.raises(InvalidRequestError):
+            folder.tags
+        with pytest.raises(InvalidRequestError):
+            folder.artifacts
+
+        # Many-to-one relationships are lazy by default; the test-wide guard
+        # (conftest.raise_on_lazy_load) turns an unplanned load into an error
+        with pytest.raises(InvalidRequestError):
+            folder.owner
+
+
+def test_lazy_load_guard_keeps_model_eager_loads(node_engine):
+    # User.default_node is lazy="joined" on the model; the guard only covers
+    # relationships left at the default lazy="select"
+    with Session(node_engine) as session:
+        user = session.execute(select(User)).unique().scalar_one()
+        assert user.default_node is None
+        session.expunge_all()
+        assert session.get(User, user.id).default_node is None
+
+
+def test_node_artifacts_batch_load_in_one_query(node_engine, count_queries):
+    with Session(node_engine) as session:
+        nodes = session.execute(select(Node)).scalars().all()
+        for node in nodes:
+            session.add(Artifact(node_id=node.id, filename="f", original_filename="f", file_path="/tmp/f", size_bytes=1))
+        session.commit()
+    with Session(node_engine) as session, count_queries(node_engine) as statements:
+        nodes = session.execute(select(Node).options(selectinload(Node.artifacts))).scalars().all()
+        assert all(len(node.artifacts) == 1 for node in nodes)
+    assert len(statements) == 2
+
+
+def test_node_type_stored_as_smallint(node_engine):
+    with node_engine.connect() as conn:
+        stored = set(conn.exec_driver_sql("SELECT node_type FROM nodes").scalars())
+    assert stored == {NodeType.folder, NodeType.task, NodeType.note}
+    with Session(node_engine) as session:
+        tasks = session.execute(select(Node).where(Node.node_type == "task")).scalars().all()
+        assert [t.node_type for t in tasks] == ["task"]
+
+
+def test_tag_color_stored_as_integer(node_engine):
+    with Session(node_engine) as session:
+        owner_id = session.execute(select(User.id)).scalar_one()
+        session.add_all([
+            Tag(owner_id=owner_id, name="red", color="#FF0000"),
+            Tag(owner_id=owner_id, name="plain", color=""),
+        ])
+        session.commit()
+    with node_engine.connect() as conn:
+        stored = dict(conn.exec_driver_sql("SELECT name, color FROM tags").all())
+    assert stored == {"red": 0xFF0000, "plain": None}
+    with Session(node_engine) as session:
+        tag = session.execute(select(Tag).where(Tag.color == "#FF0000")).scalar_one()
+        assert tag.color == "#ff0000"
+        names = session.execute(select(Tag.name).where(Tag.color.in_(["#ff0000", "#00ff00"]))).scalars().all()
+        assert names == ["red"]
+        assert session.execute(select(Tag.name).where(Tag.color.is_(None))).scalars().all() == ["plain"]
+
+
+def test_task_status_and_priority_stored_as_smallint_codes(node_engine):
+    with Session(node_engine) as session:
+        task = session.execute(select(Task)).scalar_one()
+        task.status = TaskStatus.done
+        task.priority = "urgent"
+        session.commit()
+    with node_engine.connect() as conn:
+        stored = conn.exec_driver_sql("SELECT status, priority FROM node_tasks").one()
+    assert tuple(stored) == (TaskStatusCode.done, TaskPriorityCode.urgent)
+    with Session(node_engine) as session:
+        task = session.execute(select(Task).where(Task.status == TaskStatus.done)).scalar_one()
+        assert task.status is TaskStatus.done
+        assert task.priority is TaskPriority.urgent
+
+
+def test_subtype_only_update_bumps_node_updated_at(node_engine, count_queries):
+    with Session(node_engine) as session, count_queries(node_engine) as statements:
+        task = session.execute(select(Task)).scalar_one()
+        task.description = "changed"
+        session.commit()
+    assert any(s.startswith("UPDATE nodes SET updated_at") for s in statements)
@@ -0,0 +1,184 @@
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+
+from app.services.smart_folder_engine import (
+    MATCH_NOTHING,
+    SmartFolderRulesEngine,
+    _escape_like,
+    _parse_rule_datetime,
+    _unique_conditions,
+    compute_date_context,
+)
+from app.schemas.node import SmartFolderRules
+
+
+def test_date_context_boundaries_at_year_end():
+    ctx = compute_date_context(datetime(2025, 12, 31, 18, 30, tzinfo=timezone.utc))
+    assert ctx.today_start == datetime(2025, 12, 31, tzinfo=timezone.utc)
+    # 2025-12-31 is a Wednesday
+    assert ctx.week_start == datetime(2025, 12, 29, tzinfo=timezone.utc)
+    assert ctx.week_after_next_start.date().isoformat() == "2026-01-12"
+    assert ctx.next_month_start == datetime(2026, 1, 1, tzinfo=timezone.utc)
+    assert ctx.day_start(1) == ctx.tomorrow_start == datetime(2026, 1, 1, tzinfo=timezone.utc)
+    assert ctx.day_start(-1).date().isoformat() == "2025-12-30"
+
+
+async def test_db_independent_conditions_are_compiled_once():
+    owner_id = uuid.uuid4()
+    condition = {"type": "task_status", "operator": "in", "values": ["todo", "in_progress"]}
+    first = await SmartFolderRulesEngine(session=None)._build_condition_filter(condition, owner_id)
+    # Key order of the condition dict does not matter
+    reordered = {"values": ["todo", "in_progress"], "operator": "in", "type": "task_status"}
+    second = await SmartFolderRulesEngine(session=None)._build_condition_filter(reordered, owner_id)
+    assert first is not None and second is first
+
+
+def test_and_conditions_on_one_date_column_share_predicates():
+    engine = SmartFolderRulesEngine(session=None)
+    within_week = engine._build_date_filter("due_within_days", ["7"], "due_at")
+    not_null = engine._build_date_filter("is_not_null", [], "due_at")
+    merged = engine._merge_conjuncts([within_week, not_null])
+    # task type check, IS NOT NULL, lower and upper bound
+    assert len(merged) == 4
+
+
+def test_repeated_conditions_are_compiled_once():
+    tag = {"type": "tag_contains", "operator": "any", "values": ["a"]}
+    same_tag = {"values": ["a"], "operator": "any", "type": "tag_contains"}
+    title = {"type": "title_contains", "operator": "contains", "values": ["x"]}
+    assert _unique_conditions([tag, title, same_tag]) == [tag, title]
+
+
+async def test_and_rules_with_an_unusable_condition_match_nothing():
+    engine = SmartFolderRulesEngine(session=None)
+    rules = {
+        "logic": "AND",
+        "conditions": [
+            {"type": "node_type", "operator": "equals", "values": ["task"]},
+            {"type": "task_status", "operator": "equals", "values": ["not-a-status"]},
+        ],
+    }
+    assert await engine._build_rules_clause(rules, uuid.uuid4()) is MATCH_NOTHING
+    rules["logic"] = "OR"
+    assert await engine._build_rules_clause(rules, uuid.uuid4()) is not MATCH_NOTHING
+
+
+async def test_saved_filter_cycles_terminate():
+    engine = SmartFolderRulesEngine(session=None)
+    first, second = uuid.uuid4(), uuid.uuid4()
+
+    def rule(rule_id, referenced):
+        return SimpleNamespace(id=rule_id, rule_data={
+            "logic": "AND",
+            "conditions": [{"type": "saved_filter", "operator": "equals", "values": [str(referenced)]}],
+        })
+
+    engine._rule_cache = {first: rule(first, second), second: rule(second, first)}
+    clause = await engine._build_saved_filter("equals", [str(first)], uuid.uuid4())
+    assert clause is MATCH_NOTHING
+
+
+def test_title_contains_matches_wildcards_literally():
+    assert _escape_like("100%_done\\") == "100\\%\\_done\\\\"
+
+
+def test_rule_datetimes_are_parsed_as_naive_utc():
+    assert _parse_rule_datetime("2025-03-01") == datetime(2025, 3, 1)
+    assert _parse_rule_datetime("2025-03-01T02:30:00+02:00") == datetime(2025, 3, 1, 0, 30)
+
+
+def test_validate_rules():
+    engine = SmartFolderRulesEngine(session=None)
+    assert engine.validate_rules({
+        "logic": "OR",
+        "conditions": [
+            {"type": "due_date", "operator": "is_today"},
+            {"type": "node_type", "operator": "equals", "values": ["task"]},
+        ],
+    }) == []
+    assert engine.validate_rules({
+        "conditions": [
+            {"type": "bogus", "operator": "equals", "values": ["x"]},
+            {"type": "node_type", "operator": "equals"},
+        ],
+    }) == [
+        "Condition 1 has invalid type: bogus",
+        "Condition 2 must have non-empty 'values' list",
+    ]
+
+
+def test_validate_rules_reports_non_string_values():
+    engine = SmartFolderRulesEngine(session=None)
+    for value in (None, True):
+        errors = engine.validate_rules({
+            "conditions": [{"type": "has_children", "operator": "equals", "values": [value]}],
+        })
+        assert errors
+        assert all(e.startswith("conditions.0.values.0: ") for e in errors)
+
+
+async def test_numeric_condition_values_are_read_as_strings():
+    engine = SmartFolderRulesEngine(session=None)
+    owner_id = uuid.uuid4()
+    rules = {
+        "conditions": [
+            {"type": "has_children", "operator": "equals", "values": [1]},
+            {"type": "parent_node", "operator": "equals", "values": [5]},
+            {"type": "due_date", "operator": "overdue_by_more_than", "values": [7]},
+        ],
+    }
+    assert engine.validate_rules(rules) == []
+    assert SmartFolderRules.model_validate(rules).conditions[2].values == ["7"]
+
+    has_children, parent, due = [
+        await engine._compile_condition_filter(c, owner_id) for c in rules["conditions"]
+    ]
+    assert "child_count >" in str(has_children)
+    # Not a parent id, so the condition is unusable rather than a server error
+    assert parent is None
+    assert "node_tasks.due_at <" in str(due)
+
+
+async def test_unknown_node_type_names_match_nothing():
+    engine = SmartFolderRulesEngine(session=None)
+    owner_id = uuid.uuid4()
+
+    async def compile_node_type(operator, values):
+        condition = {"type": "node_type", "operator": operator, "values": values}
+        return await engine._compile_condition_filter(condition, owner_id)
+
+    assert await compile_node_type("equals", ["bogus"]) is MATCH_NOTHING
+    assert await compile_node_type("in", ["bogus"]) is MATCH_NOTHING
+    in_clause = await compile_node_type("in", ["bogus", "task"])
+    assert in_clause.compile().params == {"node_type_1": ["task"]}
+    assert str(await compile_node_type("not_equals", ["bogus"])) == "true"
+
+
+def test_day_conditions_compile_to_half_open_column_ranges():
+    engine = SmartFolderRulesEngine(session=None)
+    for operator in ("is_today", "yesterday", "tomorrow", "this_week", "next_week", "this_month"):
+        sql = str(engine._build_date_filter(operator, [], "due_at").compile(dialect=postgresql.dialect()))
+        # The bare column is compared, so the due_at btree indexes apply
+        assert "date_trunc(" not in sql and "CAST(" not in sql
+        assert "node_tasks.due_at >= " in sql and "node_tasks.due_at < " in sql
+        assert "<=" not in sql
+
+
+async def test_evaluate_smart_folder_limits_the_node_query():
+    statements = []
+
+    class FakeSession:
+        async def execute(self, statement):
+            statements.append(statement)
+            return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: []))
+
+    engine = SmartFolderRulesEngine(session=FakeSession())
+    folder = SimpleNamespace(id=uuid.uuid4(), rule_id=None, rules={
+        "conditions": [{"type": "task_status", "operator": "equals", "values": ["todo"]}],
+    })
+    assert await engine.evaluate_smart_folder(folder, uuid.uuid4(), limit=30) == []
+    (statement,) = statements
+    assert statement._limit == 30
@@ -0,0 +1,114 @@
+import uuid
+import warnings
+from datetime import datetime, timezone
+from typing import get_args
+
+import orjson
+from pydantic import BaseModel
+
+from app.models.enums import NodeType, TaskStatus
+from app.utils import serialize
+from app.schemas.node import NODE_RESPONSE_ADAPTER, NodeResponseUnion, SmartFolderCondition
+from app.utils.serialize import serialize_models, serialize_node_row, stream_tree
+
+
+def test_serialize_node_row_encodes_uuids_datetimes_and_enums():
+    node_id = uuid.uuid4()
+    payload = orjson.loads(serialize_node_row({
+        "id": node_id,
+        "status": TaskStatus.done,
+        "node_type": NodeType.task,
+        "created_at": datetime(2025, 1, 2, 3, 4, 5),
+    }))
+    assert payload == {
+        "id": str(node_id),
+        "status": "done",
+        "node_type": 1,
+        "created_at": "2025-01-02T03:04:05+00:00",
+    }
+
+
+def test_serialize_models_matches_pydantic_json():
+    now = datetime.now(timezone.utc)
+    task = NODE_RESPONSE_ADAPTER.validate_python({
+        "id": uuid.uuid4(),
+        "owner_id": uuid.uuid4(),
+        "parent_id": None,
+        "node_type": "task",
+        "title": "Task",
+        "sort_order": 0,
+        "created_at": now,
+        "updated_at": now,
+        "tags": [{"id": uuid.uuid4(), "name": "home", "created_at": now}],
+        "task_data": {"status": "in_progress", "priority": "high"},
+    })
+    assert serialize_models([task]) == b"[" + NODE_RESPONSE_ADAPTER.dump_json(task) + b"]"
+
+
+def _response_models(annotation, seen):
+    """Every BaseModel class reachable from a (possibly nested) type annotation"""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        if annotation not in seen:
+            seen.add(annotation)
+            for field in annotation.model_fields.values():
+                _response_models(field.annotation, seen)
+    for arg in get_args(annotation):
+        _response_models(arg, seen)
+    return seen
+
+
+def test_response_models_have_no_custom_serialization():
+    # serialize_models reads field values straight from the model; a field
+    # serializer or alias on any response model would be silently skipped
+    models = _response_models(NodeResponseUnion, set())
+    assert SmartFolderCondition in models
+    for model in models:
+        decorators = model.__pydantic_decorators__
+        assert not decorators.field_serializers and not decorators.model_serializers, model
+        for name, field in model.model_fields.items():
+            assert field.serialization_alias in (None, name), (model, name)
+            assert field.alias in (None, name), (model, name)
+
+
+def test_serialize_models_reads_deprecated_fields_without_warning():
+    now = datetime.now(timezone.utc)
+    folder = NODE_RESPONSE_ADAPTER.validate_python({
+        "id": uuid.uuid4(),
+        "owner_id": uuid.uuid4(),
+        "node_type": "smart_folder",
+        "title": "Today",
+        "created_at": now,
+        "updated_at": now,
+        "smart_folder_data": {"rule_id": None, "rules": None},
+    })
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        body = serialize_models([folder])
+    assert orjson.loads(body)[0]["smart_folder_data"]["rules"] is None
+
+
+async def test_stream_tree_emits_a_valid_tree_across_chunks(monkeypatch):
+    monkeypatch.setattr(serialize, "STREAM_CHUNK_ROWS", 2)
+    root_id = uuid.uuid4()
+    rows = [{"id": uuid.uuid4(), "title": f"n{i}"} for i in range(5)]
+
+    async def items():
+        for row in rows:
+            yield row
+
+    chunks = [chunk async for chunk in stream_tree(root_id, items())]
+    assert len(chunks) > 3
+    assert orjson.loads(b"".join(chunks)) == {
+        "root_id": str(root_id),
+        "items": [{"id": str(r["id"]), "title": r["title"]} for r in rows],
+        "total_count": 5,
+    }
+
+
+async def test_stream_tree_without_items():
+    async def items():
+        return
+        yield
+
+    body = b"".join([chunk async for chunk in stream_tree(None, items())])
+    assert orjson.loads(body) == {"root_id": None, "items": [], "total_count": 0}
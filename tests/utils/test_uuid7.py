@@ -0,0 +1,18 @@
+import time
+import uuid
+
+from app.utils.uuid7 import gen_uuid_v7
+
+
+def test_gen_uuid_v7_version_and_variant():
+    value = gen_uuid_v7()
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+
+
+def test_gen_uuid_v7_is_time_ordered():
+    first = gen_uuid_v7()
+    time.sleep(0.002)
+    second = gen_uuid_v7()
+    assert first < second
+    assert first.int >> 80 <= time.time_ns() // 1_000_000